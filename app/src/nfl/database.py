@@ -8,10 +8,14 @@ This module provides functionality to:
 4. Query data and convert back to Pydantic models
 """
 
+import csv
+import io
 import logging
+import threading
 from typing import List, Dict, Any, Optional, Type
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from pydantic import BaseModel
 from enum import Enum
 import os
@@ -21,6 +25,49 @@ from .models import NFLTeamData, NFLConference, NFLGameLogData
 logger = logging.getLogger(__name__)
 
 
+class _IdleConnectionPool(ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool that opens connections on demand but keeps returned ones for reuse.
+    
+    psycopg2 only keeps a returned connection while fewer than `minconn` are idle,
+    and opens `minconn` connections up front. Raising `minconn` to the idle cap
+    after construction keeps the lazy start while letting connections be reused.
+    """
+    
+    def __init__(self, maxidle: int, maxconn: int, *args, **kwargs):
+        super().__init__(0, maxconn, *args, **kwargs)
+        self.minconn = maxidle
+
+
+# Connection pools shared by every PostgreSQLManager, one per set of connection parameters
+_pools: Dict[tuple, ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(connection_params: Dict[str, str]) -> ThreadedConnectionPool:
+    """
+    Return the shared connection pool for the given parameters, creating it on first use.
+    
+    Parameters
+    ----------
+    connection_params : dict
+        Database connection parameters
+        
+    Returns
+    -------
+    ThreadedConnectionPool
+        Pool of up to DB_POOL_MAX (default 8) connections, each kept open for reuse once returned
+    """
+    key = tuple(sorted(connection_params.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            max_connections = int(os.getenv('DB_POOL_MAX', '8'))
+            pool = _IdleConnectionPool(max_connections, max_connections, **connection_params)
+            _pools[key] = pool
+        return pool
+
+
 class PostgreSQLManager:
     """
     Manager class for PostgreSQL operations with Pydantic models.
@@ -46,23 +93,48 @@ class PostgreSQLManager:
         
         self.connection_params = connection_params
         self._connection = None
+        self._pooled = False
     
     def connect(self):
-        """Establish database connection."""
+        """Take a connection from the shared pool, or open a dedicated one if the pool is exhausted."""
         try:
-            self._connection = psycopg2.connect(**self.connection_params)
+            try:
+                self._connection = _get_pool(self.connection_params).getconn()
+                self._pooled = True
+            except PoolError:
+                self._connection = psycopg2.connect(**self.connection_params)
+                self._pooled = False
             logger.info("Connected to PostgreSQL database")
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
     def disconnect(self):
-        """Close database connection."""
+        """Return the connection to the pool (closing dedicated or broken connections)."""
         if self._connection:
-            self._connection.close()
-            self._connection = None
+            connection, self._connection = self._connection, None
+            if self._pooled:
+                self._release(connection)
+            else:
+                connection.close()
             logger.info("Disconnected from PostgreSQL database")
     
+    def _release(self, connection):
+        """Reset a pooled connection's session so the next user starts clean, then return it."""
+        pool = _get_pool(self.connection_params)
+        try:
+            if not connection.closed:
+                # Uncommitted work is discarded, exactly as closing the connection would
+                connection.rollback()
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute("DISCARD ALL")
+                connection.autocommit = False
+        except psycopg2.Error:
+            pool.putconn(connection, close=True)
+            return
+        pool.putconn(connection, close=bool(connection.closed))
+    
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -810,10 +882,75 @@ def setup_nfl_database_schema(schema: str = "nfl") -> List[str]:
 
 
 # Convenience functions for inserting game log data
+GAME_LOG_COLUMNS = (
+    'boxscore_id', 'boxscore_url', 'boxscore_date', 'boxscore_game_number', 'boxscore_home_team',
+    'week', 'game_num', 'date', 'day_of_week', 'location', 'opponent', 'result', 'team', 'season',
+    'team_score', 'opp_score', 'pass_cmp', 'pass_att', 'pass_cmp_pct', 'pass_yds', 'pass_td',
+    'pass_rate', 'pass_sk', 'pass_sk_yds', 'rush_att', 'rush_yds', 'rush_td', 'rush_ypc',
+    'tot_plays', 'tot_yds', 'tot_ypp', 'to_fumble', 'to_int', 'penalty_count', 'penalty_yds',
+    'third_down_success', 'third_down_att', 'fourth_down_success', 'fourth_down_att',
+    'time_of_possession',
+)
+
+GAME_LOG_ON_CONFLICT = """
+    ON CONFLICT (boxscore_id) DO UPDATE SET
+        updated_at = CURRENT_TIMESTAMP,
+        team_score = EXCLUDED.team_score,
+        opp_score = EXCLUDED.opp_score,
+        result = EXCLUDED.result
+"""
+
+# Batches at least this large are loaded with COPY instead of one INSERT per row
+COPY_THRESHOLD = 100
+
+
+def _copy_game_logs(db: PostgreSQLManager, game_logs: List[Dict[str, Any]], schema: str) -> None:
+    """
+    COPY game logs into a temporary staging table, then upsert them in one statement.
+    
+    Parameters
+    ----------
+    db : PostgreSQLManager
+        Connected database manager
+    game_logs : List[Dict[str, Any]]
+        Game log dictionaries that all have a boxscore_id
+    schema : str
+        Database schema name
+    """
+    column_list = ', '.join(GAME_LOG_COLUMNS)
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for game_log in game_logs:
+        writer.writerow(['\\N' if game_log[column] is None else game_log[column] for column in GAME_LOG_COLUMNS])
+    buffer.seek(0)
+    
+    with db._connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE game_logs_staging ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {schema}.game_logs WITH NO DATA"
+        )
+        # Remember arrival order so the last copy of a repeated boxscore wins, as with row-by-row inserts
+        cursor.execute("ALTER TABLE game_logs_staging ADD COLUMN copy_order bigserial")
+        cursor.copy_expert(
+            f"COPY game_logs_staging ({column_list}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')", buffer
+        )
+        cursor.execute(
+            f"INSERT INTO {schema}.game_logs ({column_list}) "
+            f"SELECT DISTINCT ON (boxscore_id) {column_list} FROM game_logs_staging "
+            f"ORDER BY boxscore_id, copy_order DESC"
+            + GAME_LOG_ON_CONFLICT
+        )
+    db._connection.commit()
+
+
 def insert_game_logs(game_logs: List[Dict[str, Any]], schema: str = "nfl") -> bool:
     """
     Insert game log data into the database.
     
+    Batches of at least COPY_THRESHOLD rows are bulk loaded with COPY; smaller
+    batches are inserted row by row.
+    
     Parameters
     ----------
     game_logs : List[Dict[str, Any]]
@@ -828,42 +965,25 @@ def insert_game_logs(game_logs: List[Dict[str, Any]], schema: str = "nfl") -> bo
     """
     try:
         with PostgreSQLManager() as db:
-            # Convert to proper format for insertion
+            # Ensure boxscore_id is present and not None
+            valid_game_logs = []
             for game_log in game_logs:
-                # Ensure boxscore_id is present and not None
                 if not game_log.get('boxscore_id'):
                     logger.warning(f"Skipping game log without boxscore_id: {game_log}")
                     continue
-                
+                valid_game_logs.append(game_log)
+            
+            if len(valid_game_logs) >= COPY_THRESHOLD:
+                _copy_game_logs(db, valid_game_logs, schema)
+            else:
                 # Insert with ON CONFLICT handling for boxscore_id
-                sql = f"""
-                INSERT INTO {schema}.game_logs (
-                    boxscore_id, boxscore_url, boxscore_date, boxscore_game_number, boxscore_home_team,
-                    week, game_num, date, day_of_week, location, opponent, result, team, season,
-                    team_score, opp_score, pass_cmp, pass_att, pass_cmp_pct, pass_yds, pass_td,
-                    pass_rate, pass_sk, pass_sk_yds, rush_att, rush_yds, rush_td, rush_ypc,
-                    tot_plays, tot_yds, tot_ypp, to_fumble, to_int, penalty_count, penalty_yds,
-                    third_down_success, third_down_att, fourth_down_success, fourth_down_att,
-                    time_of_possession
-                ) VALUES (
-                    %(boxscore_id)s, %(boxscore_url)s, %(boxscore_date)s, %(boxscore_game_number)s, 
-                    %(boxscore_home_team)s, %(week)s, %(game_num)s, %(date)s, %(day_of_week)s,
-                    %(location)s, %(opponent)s, %(result)s, %(team)s, %(season)s, %(team_score)s,
-                    %(opp_score)s, %(pass_cmp)s, %(pass_att)s, %(pass_cmp_pct)s, %(pass_yds)s,
-                    %(pass_td)s, %(pass_rate)s, %(pass_sk)s, %(pass_sk_yds)s, %(rush_att)s,
-                    %(rush_yds)s, %(rush_td)s, %(rush_ypc)s, %(tot_plays)s, %(tot_yds)s,
-                    %(tot_ypp)s, %(to_fumble)s, %(to_int)s, %(penalty_count)s, %(penalty_yds)s,
-                    %(third_down_success)s, %(third_down_att)s, %(fourth_down_success)s,
-                    %(fourth_down_att)s, %(time_of_possession)s
-                ) ON CONFLICT (boxscore_id) DO UPDATE SET
-                    updated_at = CURRENT_TIMESTAMP,
-                    team_score = EXCLUDED.team_score,
-                    opp_score = EXCLUDED.opp_score,
-                    result = EXCLUDED.result
-                """
-                
-                # Execute the insert
-                db.execute_sql(sql, game_log)
+                sql = (
+                    f"INSERT INTO {schema}.game_logs ({', '.join(GAME_LOG_COLUMNS)}) VALUES ("
+                    + ', '.join(f"%({column})s" for column in GAME_LOG_COLUMNS)
+                    + ")" + GAME_LOG_ON_CONFLICT
+                )
+                for game_log in valid_game_logs:
+                    db.execute_sql(sql, game_log)
                 
         logger.info(f"Successfully inserted {len(game_logs)} game logs")
         return True
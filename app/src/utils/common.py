@@ -3,6 +3,7 @@ from datetime import datetime
 from lxml.etree import ParserError, XMLSyntaxError
 from pyquery import PyQuery as pq
 import pycurl
+import threading
 from io import BytesIO
 import gzip
 import zlib
@@ -216,6 +217,42 @@ def _no_data_found():
     return
 
 
+# One pycurl handle per thread so repeated fetches reuse the open connection
+_curl_local = threading.local()
+
+
+def _curl_handle():
+    """
+    Get this thread's persistent pycurl handle, creating it on first use.
+
+    Reusing the handle keeps libcurl's connection cache alive between calls,
+    so consecutive requests to the same host skip the TCP and TLS handshake.
+
+    Returns
+    -------
+    pycurl.Curl
+        A configured handle owned by the calling thread.
+    """
+    c = getattr(_curl_local, "handle", None)
+    if c is None:
+        c = pycurl.Curl()
+        # Imitate command‑line curl and accept compressed responses
+        c.setopt(pycurl.USERAGENT, "curl/7.88.1")
+        c.setopt(pycurl.HTTPHEADER, [
+            "Accept: */*",
+            "Accept-Language: en-US,en;q=0.5",
+        ])
+        c.setopt(pycurl.ACCEPT_ENCODING, "gzip, deflate")
+        c.setopt(pycurl.TCP_KEEPALIVE, 1)
+        # A stalled server should fail the fetch rather than hang a worker thread
+        c.setopt(pycurl.CONNECTTIMEOUT, 10)
+        c.setopt(pycurl.TIMEOUT, 15)
+        # Negotiate HTTP/2 over TLS, falling back to HTTP/1.1 if the server declines
+        c.setopt(pycurl.HTTP_VERSION, pycurl.CURL_HTTP_VERSION_2TLS)
+        _curl_local.handle = c
+    return c
+
+
 def _curl_page(url=None, local_file=None):
     """
     Pull data from a local file if it exists, or download data from the website.
@@ -235,7 +272,8 @@ def _curl_page(url=None, local_file=None):
     Raises
     ------
     ValueError
-        If neither `url` nor `local_file` is provided.
+        If neither `url` nor `local_file` is provided, or the server answers
+        with an HTTP status other than 200.
     """
 
     # Serve from disk if a local file is provided
@@ -245,24 +283,24 @@ def _curl_page(url=None, local_file=None):
 
     if url:
         buffer = BytesIO()
-        c = pycurl.Curl()
+        c = _curl_handle()
+        # Basic request configuration
+        c.setopt(c.URL, url)
+        c.setopt(c.WRITEDATA, buffer)
+
+        # Perform the request; the handle stays open for connection reuse
         try:
-            # Basic request configuration
-            c.setopt(c.URL, url)
-            c.setopt(c.WRITEDATA, buffer)
-            # Imitate command‑line curl and accept compressed responses
-            c.setopt(pycurl.USERAGENT, "curl/7.88.1")
-            c.setopt(pycurl.HTTPHEADER, [
-                "Accept: */*",
-                "Accept-Language: en-US,en;q=0.5",
-            ])
-            c.setopt(pycurl.ACCEPT_ENCODING, "gzip, deflate")
-
-            # Perform the request
             c.perform()
-        finally:
-            # Always clean up the Curl handle
+        except pycurl.error:
+            # Don't keep reusing a handle whose connection may be broken
             c.close()
+            _curl_local.handle = None
+            raise
+
+        # Rate-limit and error pages must not be mistaken for real data
+        status = c.getinfo(pycurl.RESPONSE_CODE)
+        if status != 200:
+            raise ValueError(f"HTTP {status} fetching {url}")
 
         # Retrieve the response body
         raw = buffer.getvalue()
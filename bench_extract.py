@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark and profile the boxscore extractors on one cached page
+
+Usage:
+    python bench_extract.py [boxscore_id] [--runs N] [--html FILE] [--profile]
+"""
+
+import sys
+import os
+import argparse
+import cProfile
+import logging
+import pstats
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Load environment variables
+script_dir = Path(__file__).parent.absolute()
+env_path = script_dir / '.env'
+load_dotenv(env_path, override=True)
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+
+from nfl_boxscore_scraper import NFLBoxscoreScraper
+
+EXTRACTORS = ('extract_player_stats', 'extract_team_stats', 'extract_scoring_data')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the boxscore extractors on one page')
+    parser.add_argument('boxscore_id', nargs='?', default='202411030buf')
+    parser.add_argument('--runs', type=int, default=100, help='Iterations per function')
+    parser.add_argument('--html', help='Read the page from this file instead of the fetch cache')
+    parser.add_argument('--profile', action='store_true', help='Print a cProfile report of the full parse')
+    args = parser.parse_args()
+
+    scraper = NFLBoxscoreScraper()
+    if args.html:
+        html_content = Path(args.html).read_text(encoding='utf-8')
+    else:
+        # Served from the on-disk page cache after the first run
+        html_content = scraper.fetch_boxscore_page(args.boxscore_id)
+    if not html_content:
+        print(f"❌ Could not load boxscore {args.boxscore_id}")
+        return 1
+
+    # Per-call log lines would dominate the timings
+    logging.disable(logging.INFO)
+
+    print(f"⏱️  {args.boxscore_id}: mean of {args.runs} runs")
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        scraper.parse_boxscore_tree(html_content)
+    print(f"   {'parse_boxscore_tree':<24} {(time.perf_counter() - start) / args.runs * 1000:8.3f} ms")
+
+    for name in EXTRACTORS:
+        extract = getattr(scraper, name)
+        elapsed = 0.0
+        for _ in range(args.runs):
+            # Extractors may splice commented tables into the tree, so start fresh each run
+            tree = scraper.parse_boxscore_tree(html_content)
+            start = time.perf_counter()
+            extract(tree, args.boxscore_id)
+            elapsed += time.perf_counter() - start
+        print(f"   {name:<24} {elapsed / args.runs * 1000:8.3f} ms")
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for _ in range(args.runs):
+            scraper.parse_boxscore(args.boxscore_id, html_content)
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats('tottime').print_stats(30)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,6 @@ Collect ALL boxscore details for the 2024 season using the fixed scraper.
 
 import sys
 import os
-import time
-import random
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -30,6 +28,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Boxscore pages fetched concurrently before each round of parsing and saving
+FETCH_BATCH_SIZE = 16
+
 
 def main():
     """Collect detailed boxscore data for ALL games"""
@@ -42,7 +43,8 @@ def main():
     logger.info("=" * 60)
     logger.info(f"📅 Processing season: {season}")
     
-    scraper = FixedNFLBoxscoreScraper()
+    # Full-season backfills save through the COPY staging path
+    scraper = FixedNFLBoxscoreScraper(bulk_load=True)
     
     try:
         # Create database tables
@@ -61,28 +63,30 @@ def main():
         successful_scrapes = 0
         failed_scrapes = 0
         
-        # Process each boxscore with delay
-        for i, boxscore_id in enumerate(boxscore_ids, 1):
-            logger.info(f"🎯 Progress: {i}/{len(boxscore_ids)} - {boxscore_id}")
+        # Fetch pages in concurrent batches; the scraper's shared rate limiter
+        # keeps the overall request rate polite to the server
+        for batch_start in range(0, len(boxscore_ids), FETCH_BATCH_SIZE):
+            batch = boxscore_ids[batch_start:batch_start + FETCH_BATCH_SIZE]
+            pages = scraper.fetch_boxscore_pages(batch)
             
-            try:
-                success = scraper.scrape_boxscore_details(boxscore_id)
-                if success:
-                    successful_scrapes += 1
-                    logger.info(f"✅ Success: {boxscore_id}")
-                else:
+            for i, boxscore_id in enumerate(batch, batch_start + 1):
+                logger.info(f"🎯 Progress: {i}/{len(boxscore_ids)} - {boxscore_id}")
+                
+                try:
+                    html_content = pages.get(boxscore_id)
+                    success = html_content is not None and scraper.scrape_boxscore_details(
+                        boxscore_id, html_content=html_content
+                    )
+                    if success:
+                        successful_scrapes += 1
+                        logger.info(f"✅ Success: {boxscore_id}")
+                    else:
+                        failed_scrapes += 1
+                        logger.warning(f"❌ Failed: {boxscore_id}")
+                        
+                except Exception as e:
                     failed_scrapes += 1
-                    logger.warning(f"❌ Failed: {boxscore_id}")
-                    
-            except Exception as e:
-                failed_scrapes += 1
-                logger.error(f"❌ Error processing {boxscore_id}: {e}")
-            
-            # Add delay between requests to be respectful to the server
-            if i < len(boxscore_ids):  # Don't delay after the last item
-                delay = 30 + random.uniform(0, 5)  # 30-35 second random delay
-                logger.info(f"⏱️ Waiting {delay:.1f} seconds before next request...")
-                time.sleep(delay)
+                    logger.error(f"❌ Error processing {boxscore_id}: {e}")
         
         logger.info("=" * 60)
         logger.info(f"🎯 Collection completed!")
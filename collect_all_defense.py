@@ -8,8 +8,6 @@ It processes games that haven't had defense data collected yet.
 
 import sys
 import os
-import time
-import random
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -115,6 +113,9 @@ def main():
     # Initialize scraper
     scraper = FixedNFLBoxscoreScraper()
     
+    # Fetch every page concurrently up front; the scraper's rate limiter paces the requests
+    pages = scraper.fetch_boxscore_pages([game[0] for game in games_to_process])
+    
     # Process each game
     successful_count = 0
     failed_count = 0
@@ -125,7 +126,7 @@ def main():
         
         try:
             # Scrape the full boxscore (includes defense data)
-            success = scraper.scrape_boxscore_details(boxscore_id)
+            success = scraper.scrape_boxscore_details(boxscore_id, html_content=pages.get(boxscore_id))
             
             if success:
                 successful_count += 1
@@ -147,12 +148,6 @@ def main():
         except Exception as e:
             failed_count += 1
             logger.error(f"❌ Error processing {boxscore_id}: {e}")
-        
-        # Respectful delay between requests (10-15 seconds)
-        if i < len(games_to_process) - 1:
-            delay = random.uniform(10, 15)
-            logger.info(f"⏱️ Waiting {delay:.1f} seconds before next request...")
-            time.sleep(delay)
     
     # Final summary
     logger.info("\n" + "=" * 50)
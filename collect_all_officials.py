@@ -5,8 +5,6 @@ Collect officials data for all 2024 NFL games.
 
 import sys
 import os
-import time
-import random
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -86,7 +84,7 @@ def main():
             
             try:
                 # Fetch page and extract officials
-                soup = scraper.fetch_boxscore_html(boxscore_id)
+                soup = scraper.fetch_boxscore_html(boxscore_id, table_ids=('officials',))
                 
                 if soup:
                     officials = scraper.extract_officials_data(soup, boxscore_id)
@@ -109,12 +107,6 @@ def main():
             except Exception as e:
                 failed_scrapes += 1
                 logger.error(f"❌ Error processing {boxscore_id}: {e}")
-            
-            # Add delay between requests (10-15 seconds for officials only)
-            if i < len(boxscore_ids):
-                delay = 10 + random.uniform(0, 5)  # 10-15 second delay
-                logger.info(f"⏱️ Waiting {delay:.1f} seconds...")
-                time.sleep(delay)
         
         logger.info("=" * 60)
         logger.info(f"🎯 Officials Collection Completed!")
@@ -7,9 +7,8 @@ This script fixes the parsing issues in the original boxscore scraper.
 
 import sys
 import os
-import time
-import random
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -21,8 +20,8 @@ load_dotenv(env_path, override=True)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
 from nfl_boxscore_scraper import NFLBoxscoreScraper, BoxscorePlayerStats, BoxscoreTeamStats, BoxscoreScoring
-from src.nfl.database import PostgreSQLManager
 from bs4 import BeautifulSoup
+from psycopg2.extras import execute_values
 import logging
 
 # Configure logging
@@ -34,6 +33,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Columns each specialist table contributes to nfl.boxscore_player_stats
+DEFENSE_COLUMNS = (
+    'def_int', 'def_int_yds', 'def_int_td', 'def_pd', 'def_sacks',
+    'def_tackles', 'def_assists', 'def_fr', 'def_ff',
+)
+RETURNS_COLUMNS = (
+    'kick_returns', 'kick_return_yards', 'kick_return_avg', 'kick_return_td', 'kick_return_long',
+    'punt_returns', 'punt_return_yards', 'punt_return_avg', 'punt_return_td', 'punt_return_long',
+)
+KICKING_PUNTING_COLUMNS = (
+    'fg_made', 'fg_att', 'fg_pct', 'fg_long',
+    'fg_1_19_made', 'fg_1_19_att', 'fg_20_29_made', 'fg_20_29_att',
+    'fg_30_39_made', 'fg_30_39_att', 'fg_40_49_made', 'fg_40_49_att',
+    'fg_50_plus_made', 'fg_50_plus_att',
+    'xp_made', 'xp_att', 'xp_pct',
+    'punt_punts', 'punt_yards', 'punt_long', 'punt_avg', 'punt_net_avg',
+    'punt_in_20', 'punt_in_20_pct', 'punt_touchbacks', 'punt_touchback_pct',
+    'punt_blocked',
+)
+
 class FixedNFLBoxscoreScraper(NFLBoxscoreScraper):
     """Fixed version of the boxscore scraper with proper parsing"""
     
@@ -340,28 +359,34 @@ class FixedNFLBoxscoreScraper(NFLBoxscoreScraper):
     def save_officials_data(self, officials: list):
         """Save officials data to database"""
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    
-                    for official in officials:
-                        cursor.execute("""
-                            INSERT INTO nfl.boxscore_officials (boxscore_id, position, name, scraped_at)
-                            VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
-                            ON CONFLICT (boxscore_id, position) DO UPDATE SET
-                                name = EXCLUDED.name,
-                                scraped_at = EXCLUDED.scraped_at
-                        """, (
-                            official['boxscore_id'],
-                            official['position'], 
-                            official['name']
-                        ))
-                    
-                    db._connection.commit()
-                    logger.info(f"💾 Saved {len(officials)} officials to database")
-                    return True
-                    
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                
+                # Keyed on the conflict target so one statement never updates a row twice
+                official_rows = {
+                    (official['boxscore_id'], official['position']): (
+                        official['boxscore_id'],
+                        official['position'], 
+                        official['name']
+                    )
+                    for official in officials
+                }
+                execute_values(cursor, """
+                    INSERT INTO nfl.boxscore_officials (boxscore_id, position, name, scraped_at)
+                    VALUES %s
+                    ON CONFLICT (boxscore_id, position) DO UPDATE SET
+                        name = EXCLUDED.name,
+                        scraped_at = EXCLUDED.scraped_at
+                """, list(official_rows.values()), template="(%s, %s, %s, CURRENT_TIMESTAMP)")
+                
+                connection.commit()
+                logger.info(f"💾 Saved {len(officials)} officials to database")
+                return True
+                
         except Exception as e:
             logger.error(f"❌ Error saving officials data: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             return False
 
     def extract_defense_data(self, soup: BeautifulSoup, boxscore_id: str) -> list:
@@ -437,75 +462,48 @@ class FixedNFLBoxscoreScraper(NFLBoxscoreScraper):
         
         return defense_stats
 
+    def _upsert_player_columns(self, cursor, stats: list, columns: tuple):
+        """Write one group of columns onto nfl.boxscore_player_stats rows in a single statement
+        
+        Existing (boxscore_id, player_name, team) rows get just these columns updated;
+        players without a row yet are inserted.
+        """
+        # Keyed on the conflict target so one statement never updates a row twice
+        player_rows = {
+            (stat['boxscore_id'], stat['player_name'], stat['team']): (
+                stat['boxscore_id'], stat['player_name'], stat['team'],
+                *(stat[column] for column in columns)
+            )
+            for stat in stats
+        }
+        updates = ', '.join(f"{column} = EXCLUDED.{column}" for column in columns)
+        execute_values(cursor, f"""
+            INSERT INTO nfl.boxscore_player_stats (
+                boxscore_id, player_name, team, {', '.join(columns)}, created_at
+            ) VALUES %s
+            ON CONFLICT (boxscore_id, player_name, team) DO UPDATE SET
+                {updates},
+                created_at = CURRENT_TIMESTAMP
+        """, list(player_rows.values()),
+            template=f"({', '.join(['%s'] * (len(columns) + 3))}, CURRENT_TIMESTAMP)")
+
     def save_defense_data(self, defense_stats: list):
         """Save defense data as new player records or update existing ones"""
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    
-                    for defense in defense_stats:
-                        # Try to update existing record first, then insert if not found
-                        cursor.execute("""
-                            UPDATE nfl.boxscore_player_stats 
-                            SET 
-                                def_int = %s,
-                                def_int_yds = %s,
-                                def_int_td = %s,
-                                def_pd = %s,
-                                def_sacks = %s,
-                                def_tackles = %s,
-                                def_assists = %s,
-                                def_fr = %s,
-                                def_ff = %s,
-                                created_at = CURRENT_TIMESTAMP
-                            WHERE boxscore_id = %s AND player_name = %s AND team = %s
-                        """, (
-                            defense['def_int'],
-                            defense['def_int_yds'],
-                            defense['def_int_td'],
-                            defense['def_pd'],
-                            defense['def_sacks'],
-                            defense['def_tackles'],
-                            defense['def_assists'],
-                            defense['def_fr'],
-                            defense['def_ff'],
-                            defense['boxscore_id'],
-                            defense['player_name'],
-                            defense['team']
-                        ))
-                        
-                        # If no rows were updated, insert a new record
-                        if cursor.rowcount == 0:
-                            cursor.execute("""
-                                INSERT INTO nfl.boxscore_player_stats (
-                                    boxscore_id, player_name, team,
-                                    def_int, def_int_yds, def_int_td, def_pd, def_sacks,
-                                    def_tackles, def_assists, def_fr, def_ff,
-                                    created_at
-                                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-                            """, (
-                                defense['boxscore_id'],
-                                defense['player_name'],
-                                defense['team'],
-                                defense['def_int'],
-                                defense['def_int_yds'],
-                                defense['def_int_td'],
-                                defense['def_pd'],
-                                defense['def_sacks'],
-                                defense['def_tackles'],
-                                defense['def_assists'],
-                                defense['def_fr'],
-                                defense['def_ff']
-                            ))
-                    
-                    db._connection.commit()
-                    logger.info(f"💾 Processed {len(defense_stats)} defensive player records")
-                    return True
-                    
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                self._upsert_player_columns(cursor, defense_stats, DEFENSE_COLUMNS)
+                connection.commit()
+                logger.info(f"💾 Processed {len(defense_stats)} defensive player records")
+                return True
+                
         except Exception as e:
             logger.error(f"❌ Error saving defense data: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             return False
 
+
     def extract_returns_data(self, soup: BeautifulSoup, boxscore_id: str) -> list:
         """Extract kick and punt return statistics"""
         returns_stats = []
@@ -583,77 +581,20 @@ class FixedNFLBoxscoreScraper(NFLBoxscoreScraper):
     def save_returns_data(self, returns_stats: list):
         """Save return data to the existing player stats table"""
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    
-                    for returns in returns_stats:
-                        # First try to update existing player record
-                        cursor.execute("""
-                            UPDATE nfl.boxscore_player_stats 
-                            SET 
-                                kick_returns = %s,
-                                kick_return_yards = %s,
-                                kick_return_avg = %s,
-                                kick_return_td = %s,
-                                kick_return_long = %s,
-                                punt_returns = %s,
-                                punt_return_yards = %s,
-                                punt_return_avg = %s,
-                                punt_return_td = %s,
-                                punt_return_long = %s,
-                                created_at = CURRENT_TIMESTAMP
-                            WHERE boxscore_id = %s AND player_name = %s AND team = %s
-                        """, (
-                            returns['kick_returns'],
-                            returns['kick_return_yards'],
-                            returns['kick_return_avg'],
-                            returns['kick_return_td'],
-                            returns['kick_return_long'],
-                            returns['punt_returns'],
-                            returns['punt_return_yards'],
-                            returns['punt_return_avg'],
-                            returns['punt_return_td'],
-                            returns['punt_return_long'],
-                            returns['boxscore_id'],
-                            returns['player_name'],
-                            returns['team']
-                        ))
-                        
-                        # If no rows were updated, insert a new player record
-                        if cursor.rowcount == 0:
-                            cursor.execute("""
-                                INSERT INTO nfl.boxscore_player_stats (
-                                    boxscore_id, player_name, team,
-                                    kick_returns, kick_return_yards, kick_return_avg, kick_return_td, kick_return_long,
-                                    punt_returns, punt_return_yards, punt_return_avg, punt_return_td, punt_return_long,
-                                    created_at
-                                ) VALUES (
-                                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP
-                                )
-                            """, (
-                                returns['boxscore_id'],
-                                returns['player_name'],
-                                returns['team'],
-                                returns['kick_returns'],
-                                returns['kick_return_yards'],
-                                returns['kick_return_avg'],
-                                returns['kick_return_td'],
-                                returns['kick_return_long'],
-                                returns['punt_returns'],
-                                returns['punt_return_yards'],
-                                returns['punt_return_avg'],
-                                returns['punt_return_td'],
-                                returns['punt_return_long']
-                            ))
-                    
-                    db._connection.commit()
-                    logger.info(f"💾 Processed {len(returns_stats)} return specialist records")
-                    return True
-                    
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                self._upsert_player_columns(cursor, returns_stats, RETURNS_COLUMNS)
+                connection.commit()
+                logger.info(f"💾 Processed {len(returns_stats)} return specialist records")
+                return True
+                
         except Exception as e:
             logger.error(f"❌ Error saving returns data: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             return False
 
+
     def extract_kicking_punting_data(self, soup: BeautifulSoup, boxscore_id: str) -> list:
         """Extract kicking and punting statistics"""
         kicking_stats = []
@@ -781,81 +722,17 @@ class FixedNFLBoxscoreScraper(NFLBoxscoreScraper):
     def save_kicking_punting_data(self, kicking_stats: list):
         """Save kicking and punting data to the existing player stats table"""
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    
-                    for kicking in kicking_stats:
-                        # First try to update existing player record
-                        cursor.execute("""
-                            UPDATE nfl.boxscore_player_stats 
-                            SET 
-                                fg_made = %s, fg_att = %s, fg_pct = %s, fg_long = %s,
-                                fg_1_19_made = %s, fg_1_19_att = %s,
-                                fg_20_29_made = %s, fg_20_29_att = %s,
-                                fg_30_39_made = %s, fg_30_39_att = %s,
-                                fg_40_49_made = %s, fg_40_49_att = %s,
-                                fg_50_plus_made = %s, fg_50_plus_att = %s,
-                                xp_made = %s, xp_att = %s, xp_pct = %s,
-                                punt_punts = %s, punt_yards = %s, punt_long = %s,
-                                punt_avg = %s, punt_net_avg = %s,
-                                punt_in_20 = %s, punt_in_20_pct = %s,
-                                punt_touchbacks = %s, punt_touchback_pct = %s,
-                                punt_blocked = %s,
-                                created_at = CURRENT_TIMESTAMP
-                            WHERE boxscore_id = %s AND player_name = %s AND team = %s
-                        """, (
-                            kicking['fg_made'], kicking['fg_att'], kicking['fg_pct'], kicking['fg_long'],
-                            kicking['fg_1_19_made'], kicking['fg_1_19_att'],
-                            kicking['fg_20_29_made'], kicking['fg_20_29_att'],
-                            kicking['fg_30_39_made'], kicking['fg_30_39_att'],
-                            kicking['fg_40_49_made'], kicking['fg_40_49_att'],
-                            kicking['fg_50_plus_made'], kicking['fg_50_plus_att'],
-                            kicking['xp_made'], kicking['xp_att'], kicking['xp_pct'],
-                            kicking['punt_punts'], kicking['punt_yards'], kicking['punt_long'],
-                            kicking['punt_avg'], kicking['punt_net_avg'],
-                            kicking['punt_in_20'], kicking['punt_in_20_pct'],
-                            kicking['punt_touchbacks'], kicking['punt_touchback_pct'],
-                            kicking['punt_blocked'],
-                            kicking['boxscore_id'], kicking['player_name'], kicking['team']
-                        ))
-                        
-                        # If no rows were updated, insert a new player record
-                        if cursor.rowcount == 0:
-                            cursor.execute("""
-                                INSERT INTO nfl.boxscore_player_stats (
-                                    boxscore_id, player_name, team,
-                                    fg_made, fg_att, fg_pct, fg_long,
-                                    fg_1_19_made, fg_1_19_att, fg_20_29_made, fg_20_29_att,
-                                    fg_30_39_made, fg_30_39_att, fg_40_49_made, fg_40_49_att,
-                                    fg_50_plus_made, fg_50_plus_att,
-                                    xp_made, xp_att, xp_pct,
-                                    punt_punts, punt_yards, punt_long, punt_avg, punt_net_avg,
-                                    punt_in_20, punt_in_20_pct, punt_touchbacks, punt_touchback_pct,
-                                    punt_blocked, created_at
-                                ) VALUES (
-                                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP
-                                )
-                            """, (
-                                kicking['boxscore_id'], kicking['player_name'], kicking['team'],
-                                kicking['fg_made'], kicking['fg_att'], kicking['fg_pct'], kicking['fg_long'],
-                                kicking['fg_1_19_made'], kicking['fg_1_19_att'], kicking['fg_20_29_made'], kicking['fg_20_29_att'],
-                                kicking['fg_30_39_made'], kicking['fg_30_39_att'], kicking['fg_40_49_made'], kicking['fg_40_49_att'],
-                                kicking['fg_50_plus_made'], kicking['fg_50_plus_att'],
-                                kicking['xp_made'], kicking['xp_att'], kicking['xp_pct'],
-                                kicking['punt_punts'], kicking['punt_yards'], kicking['punt_long'],
-                                kicking['punt_avg'], kicking['punt_net_avg'],
-                                kicking['punt_in_20'], kicking['punt_in_20_pct'],
-                                kicking['punt_touchbacks'], kicking['punt_touchback_pct'],
-                                kicking['punt_blocked']
-                            ))
-                    
-                    db._connection.commit()
-                    logger.info(f"💾 Processed {len(kicking_stats)} kicking/punting records")
-                    return True
-                    
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                self._upsert_player_columns(cursor, kicking_stats, KICKING_PUNTING_COLUMNS)
+                connection.commit()
+                logger.info(f"💾 Processed {len(kicking_stats)} kicking/punting records")
+                return True
+                
         except Exception as e:
             logger.error(f"❌ Error saving kicking/punting data: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             return False
 
 
@@ -987,73 +864,76 @@ class FixedNFLBoxscoreScraper(NFLBoxscoreScraper):
     def save_advanced_passing_data(self, advanced_passing_stats: list):
         """Save advanced passing data to the dedicated table"""
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    
-                    for adv_pass in advanced_passing_stats:
-                        # Insert or update advanced passing record
-                        cursor.execute("""
-                            INSERT INTO nfl.boxscore_advanced_passing (
-                                boxscore_id, player_name, team,
-                                cmp, att, yds,
-                                first_downs, first_down_pct,
-                                intended_air_yards, intended_air_yards_per_att,
-                                completed_air_yards, completed_air_yards_per_cmp, completed_air_yards_per_att,
-                                yac, yac_per_cmp,
-                                drops, drop_pct, bad_throws, bad_throw_pct,
-                                sacks, blitzes_faced, hurries, hits, pressures, pressure_pct,
-                                scrambles, scramble_yards_per_scramble,
-                                created_at
-                            ) VALUES (
-                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                                %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP
-                            ) ON CONFLICT (boxscore_id, player_name, team) 
-                            DO UPDATE SET
-                                cmp = EXCLUDED.cmp,
-                                att = EXCLUDED.att,
-                                yds = EXCLUDED.yds,
-                                first_downs = EXCLUDED.first_downs,
-                                first_down_pct = EXCLUDED.first_down_pct,
-                                intended_air_yards = EXCLUDED.intended_air_yards,
-                                intended_air_yards_per_att = EXCLUDED.intended_air_yards_per_att,
-                                completed_air_yards = EXCLUDED.completed_air_yards,
-                                completed_air_yards_per_cmp = EXCLUDED.completed_air_yards_per_cmp,
-                                completed_air_yards_per_att = EXCLUDED.completed_air_yards_per_att,
-                                yac = EXCLUDED.yac,
-                                yac_per_cmp = EXCLUDED.yac_per_cmp,
-                                drops = EXCLUDED.drops,
-                                drop_pct = EXCLUDED.drop_pct,
-                                bad_throws = EXCLUDED.bad_throws,
-                                bad_throw_pct = EXCLUDED.bad_throw_pct,
-                                sacks = EXCLUDED.sacks,
-                                blitzes_faced = EXCLUDED.blitzes_faced,
-                                hurries = EXCLUDED.hurries,
-                                hits = EXCLUDED.hits,
-                                pressures = EXCLUDED.pressures,
-                                pressure_pct = EXCLUDED.pressure_pct,
-                                scrambles = EXCLUDED.scrambles,
-                                scramble_yards_per_scramble = EXCLUDED.scramble_yards_per_scramble,
-                                created_at = CURRENT_TIMESTAMP
-                        """, (
-                            adv_pass['boxscore_id'], adv_pass['player_name'], adv_pass['team'],
-                            adv_pass['cmp'], adv_pass['att'], adv_pass['yds'],
-                            adv_pass['first_downs'], adv_pass['first_down_pct'],
-                            adv_pass['intended_air_yards'], adv_pass['intended_air_yards_per_att'],
-                            adv_pass['completed_air_yards'], adv_pass['completed_air_yards_per_cmp'], 
-                            adv_pass['completed_air_yards_per_att'],
-                            adv_pass['yac'], adv_pass['yac_per_cmp'],
-                            adv_pass['drops'], adv_pass['drop_pct'], adv_pass['bad_throws'], adv_pass['bad_throw_pct'],
-                            adv_pass['sacks'], adv_pass['blitzes_faced'], adv_pass['hurries'], 
-                            adv_pass['hits'], adv_pass['pressures'], adv_pass['pressure_pct'],
-                            adv_pass['scrambles'], adv_pass['scramble_yards_per_scramble']
-                        ))
-                    
-                    db._connection.commit()
-                    logger.info(f"💾 Processed {len(advanced_passing_stats)} advanced passing records")
-                    return True
-                    
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                
+                # Keyed on the conflict target so one statement never updates a row twice
+                passing_rows = {
+                    (adv_pass['boxscore_id'], adv_pass['player_name'], adv_pass['team']): (
+                        adv_pass['boxscore_id'], adv_pass['player_name'], adv_pass['team'],
+                        adv_pass['cmp'], adv_pass['att'], adv_pass['yds'],
+                        adv_pass['first_downs'], adv_pass['first_down_pct'],
+                        adv_pass['intended_air_yards'], adv_pass['intended_air_yards_per_att'],
+                        adv_pass['completed_air_yards'], adv_pass['completed_air_yards_per_cmp'], 
+                        adv_pass['completed_air_yards_per_att'],
+                        adv_pass['yac'], adv_pass['yac_per_cmp'],
+                        adv_pass['drops'], adv_pass['drop_pct'], adv_pass['bad_throws'], adv_pass['bad_throw_pct'],
+                        adv_pass['sacks'], adv_pass['blitzes_faced'], adv_pass['hurries'], 
+                        adv_pass['hits'], adv_pass['pressures'], adv_pass['pressure_pct'],
+                        adv_pass['scrambles'], adv_pass['scramble_yards_per_scramble']
+                    )
+                    for adv_pass in advanced_passing_stats
+                }
+                execute_values(cursor, """
+                    INSERT INTO nfl.boxscore_advanced_passing (
+                        boxscore_id, player_name, team,
+                        cmp, att, yds,
+                        first_downs, first_down_pct,
+                        intended_air_yards, intended_air_yards_per_att,
+                        completed_air_yards, completed_air_yards_per_cmp, completed_air_yards_per_att,
+                        yac, yac_per_cmp,
+                        drops, drop_pct, bad_throws, bad_throw_pct,
+                        sacks, blitzes_faced, hurries, hits, pressures, pressure_pct,
+                        scrambles, scramble_yards_per_scramble,
+                        created_at
+                    ) VALUES %s
+                    ON CONFLICT (boxscore_id, player_name, team) 
+                    DO UPDATE SET
+                        cmp = EXCLUDED.cmp,
+                        att = EXCLUDED.att,
+                        yds = EXCLUDED.yds,
+                        first_downs = EXCLUDED.first_downs,
+                        first_down_pct = EXCLUDED.first_down_pct,
+                        intended_air_yards = EXCLUDED.intended_air_yards,
+                        intended_air_yards_per_att = EXCLUDED.intended_air_yards_per_att,
+                        completed_air_yards = EXCLUDED.completed_air_yards,
+                        completed_air_yards_per_cmp = EXCLUDED.completed_air_yards_per_cmp,
+                        completed_air_yards_per_att = EXCLUDED.completed_air_yards_per_att,
+                        yac = EXCLUDED.yac,
+                        yac_per_cmp = EXCLUDED.yac_per_cmp,
+                        drops = EXCLUDED.drops,
+                        drop_pct = EXCLUDED.drop_pct,
+                        bad_throws = EXCLUDED.bad_throws,
+                        bad_throw_pct = EXCLUDED.bad_throw_pct,
+                        sacks = EXCLUDED.sacks,
+                        blitzes_faced = EXCLUDED.blitzes_faced,
+                        hurries = EXCLUDED.hurries,
+                        hits = EXCLUDED.hits,
+                        pressures = EXCLUDED.pressures,
+                        pressure_pct = EXCLUDED.pressure_pct,
+                        scrambles = EXCLUDED.scrambles,
+                        scramble_yards_per_scramble = EXCLUDED.scramble_yards_per_scramble,
+                        created_at = CURRENT_TIMESTAMP
+                """, list(passing_rows.values()), template="(" + ", ".join(["%s"] * 27) + ", CURRENT_TIMESTAMP)")
+                
+                connection.commit()
+                logger.info(f"💾 Processed {len(advanced_passing_stats)} advanced passing records")
+                return True
+                
         except Exception as e:
             logger.error(f"❌ Error saving advanced passing data: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             return False
 
 
@@ -1157,63 +1037,72 @@ class FixedNFLBoxscoreScraper(NFLBoxscoreScraper):
     def save_advanced_rushing_data(self, advanced_rushing_stats: list):
         """Save advanced rushing data to the dedicated table"""
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    
-                    for rushing in advanced_rushing_stats:
-                        cursor.execute("""
-                            INSERT INTO nfl.boxscore_advanced_rushing (
-                                boxscore_id, player_name, team,
-                                rush_att, rush_yds, rush_td, rush_first_downs,
-                                yards_before_contact, yards_before_contact_per_att,
-                                yards_after_contact, yards_after_contact_per_att,
-                                broken_tackles, att_per_broken_tackle
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (boxscore_id, player_name, team) 
-                            DO UPDATE SET
-                                rush_att = EXCLUDED.rush_att,
-                                rush_yds = EXCLUDED.rush_yds,
-                                rush_td = EXCLUDED.rush_td,
-                                rush_first_downs = EXCLUDED.rush_first_downs,
-                                yards_before_contact = EXCLUDED.yards_before_contact,
-                                yards_before_contact_per_att = EXCLUDED.yards_before_contact_per_att,
-                                yards_after_contact = EXCLUDED.yards_after_contact,
-                                yards_after_contact_per_att = EXCLUDED.yards_after_contact_per_att,
-                                broken_tackles = EXCLUDED.broken_tackles,
-                                att_per_broken_tackle = EXCLUDED.att_per_broken_tackle,
-                                updated_at = CURRENT_TIMESTAMP
-                        """, (
-                            rushing['boxscore_id'],
-                            rushing['player_name'],
-                            rushing['team'],
-                            rushing['rush_att'],
-                            rushing['rush_yds'],
-                            rushing['rush_td'],
-                            rushing['rush_first_downs'],
-                            rushing['yards_before_contact'],
-                            rushing['yards_before_contact_per_att'],
-                            rushing['yards_after_contact'],
-                            rushing['yards_after_contact_per_att'],
-                            rushing['broken_tackles'],
-                            rushing['att_per_broken_tackle']
-                        ))
-                    
-                    db._connection.commit()
-                    logger.info(f"💾 Processed {len(advanced_rushing_stats)} advanced rushing records")
-                    return True
-                    
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                
+                # Keyed on the conflict target so one statement never updates a row twice
+                rushing_rows = {
+                    (rushing['boxscore_id'], rushing['player_name'], rushing['team']): (
+                        rushing['boxscore_id'],
+                        rushing['player_name'],
+                        rushing['team'],
+                        rushing['rush_att'],
+                        rushing['rush_yds'],
+                        rushing['rush_td'],
+                        rushing['rush_first_downs'],
+                        rushing['yards_before_contact'],
+                        rushing['yards_before_contact_per_att'],
+                        rushing['yards_after_contact'],
+                        rushing['yards_after_contact_per_att'],
+                        rushing['broken_tackles'],
+                        rushing['att_per_broken_tackle']
+                    )
+                    for rushing in advanced_rushing_stats
+                }
+                execute_values(cursor, """
+                    INSERT INTO nfl.boxscore_advanced_rushing (
+                        boxscore_id, player_name, team,
+                        rush_att, rush_yds, rush_td, rush_first_downs,
+                        yards_before_contact, yards_before_contact_per_att,
+                        yards_after_contact, yards_after_contact_per_att,
+                        broken_tackles, att_per_broken_tackle
+                    ) VALUES %s
+                    ON CONFLICT (boxscore_id, player_name, team) 
+                    DO UPDATE SET
+                        rush_att = EXCLUDED.rush_att,
+                        rush_yds = EXCLUDED.rush_yds,
+                        rush_td = EXCLUDED.rush_td,
+                        rush_first_downs = EXCLUDED.rush_first_downs,
+                        yards_before_contact = EXCLUDED.yards_before_contact,
+                        yards_before_contact_per_att = EXCLUDED.yards_before_contact_per_att,
+                        yards_after_contact = EXCLUDED.yards_after_contact,
+                        yards_after_contact_per_att = EXCLUDED.yards_after_contact_per_att,
+                        broken_tackles = EXCLUDED.broken_tackles,
+                        att_per_broken_tackle = EXCLUDED.att_per_broken_tackle,
+                        updated_at = CURRENT_TIMESTAMP
+                """, list(rushing_rows.values()))
+                
+                connection.commit()
+                logger.info(f"💾 Processed {len(advanced_rushing_stats)} advanced rushing records")
+                return True
+                
         except Exception as e:
             logger.error(f"❌ Error saving advanced rushing data: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             return False
 
 
-    def scrape_boxscore_details(self, boxscore_id: str) -> bool:
+    def scrape_boxscore_details(self, boxscore_id: str, html_content: Optional[str] = None) -> bool:
         """Scrape detailed statistics for a single boxscore - ENHANCED VERSION"""
         logger.info(f"🔍 Scraping boxscore details: {boxscore_id}")
         
         try:
-            # Fetch the HTML
-            soup = self.fetch_boxscore_html(boxscore_id)
+            # Fetch the HTML, or parse the page that was already fetched in a batch
+            if html_content is not None:
+                soup = self.parse_boxscore_soup(html_content)
+            else:
+                soup = self.fetch_boxscore_html(boxscore_id)
             if not soup:
                 return False
             
@@ -1277,39 +1166,37 @@ def main():
         
         logger.info(f"📋 Found {len(boxscore_ids)} boxscores to scrape")
         
-        # Scrape each boxscore
+        # Fetch the pages concurrently, then scrape each boxscore
+        pages = scraper.fetch_boxscore_pages(boxscore_ids)
         successful_scrapes = 0
         for i, boxscore_id in enumerate(boxscore_ids):
             logger.info(f"🎯 Progress: {i+1}/{len(boxscore_ids)}")
-            if scraper.scrape_boxscore_details(boxscore_id):
+            if scraper.scrape_boxscore_details(boxscore_id, html_content=pages.get(boxscore_id)):
                 successful_scrapes += 1
-            
-            # Be respectful with delays between requests
-            if i < len(boxscore_ids) - 1:
-                time.sleep(random.uniform(2, 4))
         
         logger.info(f"🎯 Scraping completed: {successful_scrapes}/{len(boxscore_ids)} successful")
         
         # Show results
         logger.info("\n📊 Final results:")
-        with PostgreSQLManager() as db:
-            with db._connection.cursor() as cursor:
-                cursor.execute("SELECT COUNT(*) FROM nfl.boxscore_player_stats")
-                player_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM nfl.boxscore_team_stats")
-                team_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM nfl.boxscore_scoring")
-                scoring_count = cursor.fetchone()[0]
-                
-                logger.info(f"   👥 Player stats: {player_count} records")
-                logger.info(f"   🏟️ Team stats: {team_count} records")
-                logger.info(f"   🏆 Scoring events: {scoring_count} records")
+        with scraper._get_connection().cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM nfl.boxscore_player_stats")
+            player_count = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM nfl.boxscore_team_stats")
+            team_count = cursor.fetchone()[0]
+            
+            cursor.execute("SELECT COUNT(*) FROM nfl.boxscore_scoring")
+            scoring_count = cursor.fetchone()[0]
+            
+            logger.info(f"   👥 Player stats: {player_count} records")
+            logger.info(f"   🏟️ Team stats: {team_count} records")
+            logger.info(f"   🏆 Scoring events: {scoring_count} records")
                     
     except Exception as e:
         logger.error(f"❌ Scraping failed: {e}")
         raise
+    finally:
+        scraper.close()
 
 
 if __name__ == "__main__":
@@ -23,6 +23,8 @@ from loguru import logger
 from dotenv import load_dotenv
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+from types import MappingProxyType
+from string import Template
 
 # Load environment variables
 env_path = Path(__file__).parent / '.env'
@@ -34,7 +36,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 from src.nfl.database import PostgreSQLManager
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SportConfig:
     """Configuration for a sport's database structure."""
     name: str
@@ -47,96 +49,17 @@ class SportConfig:
     season_structure: str = "fall"  # fall, winter, spring, split
 
 
-class MultiSportDatabaseManager:
-    """
-    Unified database manager for all sports in the All Sports Reference system.
-    """
-    
-    def __init__(self):
-        """Initialize the multi-sport database manager."""
-        self.sports_configs = {
-            'nfl': SportConfig(
-                name='nfl',
-                display_name='NFL',
-                schema_name='nfl',
-                primary_table='game_logs',
-                boxscore_table='boxscore_details',
-                has_boxscores=True,
-                has_playoffs=True,
-                season_structure='fall'
-            ),
-            'nba': SportConfig(
-                name='nba',
-                display_name='NBA',
-                schema_name='nba',
-                primary_table='game_logs',
-                boxscore_table='boxscore_details',
-                has_boxscores=True,
-                has_playoffs=True,
-                season_structure='winter'
-            ),
-            'nhl': SportConfig(
-                name='nhl',
-                display_name='NHL',
-                schema_name='nhl',
-                primary_table='game_logs',
-                boxscore_table='boxscore_details',
-                has_boxscores=True,
-                has_playoffs=True,
-                season_structure='winter'
-            ),
-            'ncaaf': SportConfig(
-                name='ncaaf',
-                display_name='NCAA Football',
-                schema_name='ncaaf',
-                primary_table='game_logs',
-                boxscore_table='boxscore_details',
-                has_boxscores=True,
-                has_playoffs=True,
-                season_structure='fall'
-            ),
-            'ncaab': SportConfig(
-                name='ncaab',
-                display_name='NCAA Basketball',
-                schema_name='ncaab',
-                primary_table='game_logs',
-                boxscore_table='boxscore_details',
-                has_boxscores=True,
-                has_playoffs=True,
-                season_structure='winter'
-            )
-        }
-    
-    def get_sport_config(self, sport: str) -> SportConfig:
-        """Get configuration for a specific sport."""
-        if sport.lower() not in self.sports_configs:
-            raise ValueError(f"Unsupported sport: {sport}. Available: {list(self.sports_configs.keys())}")
-        return self.sports_configs[sport.lower()]
-    
-    def list_sports(self) -> List[SportConfig]:
-        """List all configured sports."""
-        return list(self.sports_configs.values())
-    
-    def create_nba_schema(self, schema: str = "nba") -> str:
-        """
-        Generate CREATE TABLE SQL for NBA game log data.
-        
-        NBA games have different statistics compared to NFL:
-        - Points, rebounds, assists instead of passing/rushing yards
-        - Field goals, three-pointers, free throws
-        - Different game structure (4 quarters vs 4 quarters + OT)
-        """
-        sql = f"""
+# DDL templates are parsed once at import; only the schema name varies per call.
+_NBA_SCHEMA_TEMPLATE = Template("""
 -- Create schema if it doesn't exist
-CREATE SCHEMA IF NOT EXISTS {schema};
+CREATE SCHEMA IF NOT EXISTS ${schema};
 
 -- Create NBA game log table with basketball-specific statistics
-CREATE TABLE IF NOT EXISTS {schema}.game_logs (
+CREATE TABLE IF NOT EXISTS ${schema}.game_logs (
     id SERIAL PRIMARY KEY,
     
     -- Unique game identifier (critical for linking tables)
     boxscore_id VARCHAR(20) UNIQUE NOT NULL,
-    boxscore_url TEXT,
     boxscore_date DATE,
     boxscore_game_number INTEGER DEFAULT 0,
     boxscore_home_team VARCHAR(4),
@@ -200,23 +123,22 @@ CREATE TABLE IF NOT EXISTS {schema}.game_logs (
     CONSTRAINT nba_game_logs_scores_non_negative CHECK (team_score >= 0 AND opp_score >= 0)
 );
 
--- Critical indexes for performance and linking
-CREATE UNIQUE INDEX IF NOT EXISTS idx_nba_game_logs_boxscore_id ON {schema}.game_logs(boxscore_id);
-CREATE INDEX IF NOT EXISTS idx_nba_game_logs_team_season ON {schema}.game_logs(team, season);
-CREATE INDEX IF NOT EXISTS idx_nba_game_logs_date ON {schema}.game_logs(date);
-CREATE INDEX IF NOT EXISTS idx_nba_game_logs_opponent ON {schema}.game_logs(opponent);
-CREATE INDEX IF NOT EXISTS idx_nba_game_logs_home_team ON {schema}.game_logs(boxscore_home_team);
-CREATE INDEX IF NOT EXISTS idx_nba_game_logs_result ON {schema}.game_logs(result);
+-- Boxscore URLs live in a 1:1 side table so game_logs rows stay narrow for analytic scans
+CREATE TABLE IF NOT EXISTS ${schema}.game_logs_urls (
+    boxscore_id VARCHAR(20) PRIMARY KEY
+        REFERENCES ${schema}.game_logs(boxscore_id) ON DELETE CASCADE,
+    boxscore_url TEXT
+);
 
 -- Create update trigger for updated_at
-DROP TRIGGER IF EXISTS update_nba_game_logs_modtime ON {schema}.game_logs;
+DROP TRIGGER IF EXISTS update_nba_game_logs_modtime ON ${schema}.game_logs;
 CREATE TRIGGER update_nba_game_logs_modtime
-    BEFORE UPDATE ON {schema}.game_logs
+    BEFORE UPDATE ON ${schema}.game_logs
     FOR EACH ROW
     EXECUTE FUNCTION update_modified_column();
 
 -- Create a view for easy game analysis
-CREATE OR REPLACE VIEW {schema}.game_summary AS
+CREATE OR REPLACE VIEW ${schema}.game_summary AS
 SELECT 
     boxscore_id,
     date,
@@ -237,43 +159,62 @@ SELECT
     treb as total_rebounds,
     ast as assists,
     tov as turnovers,
-    boxscore_url
-FROM {schema}.game_logs
+    u.boxscore_url
+FROM ${schema}.game_logs
+LEFT JOIN ${schema}.game_logs_urls u USING (boxscore_id)
 ORDER BY date, boxscore_id;
 
+-- Databases created before game_logs_urls kept the URL on game_logs: copy it
+-- across once, then drop the old column (after the view above stops using it).
+-- (The doubled dollar quotes are string.Template escapes.)
+DO $$$$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = '${schema}' AND table_name = 'game_logs' AND column_name = 'boxscore_url'
+    ) THEN
+        INSERT INTO ${schema}.game_logs_urls (boxscore_id, boxscore_url)
+        SELECT boxscore_id, boxscore_url FROM ${schema}.game_logs
+        WHERE boxscore_id IS NOT NULL AND boxscore_url IS NOT NULL
+        ON CONFLICT DO NOTHING;
+        ALTER TABLE ${schema}.game_logs DROP COLUMN IF EXISTS boxscore_url;
+    END IF;
+END
+$$$$;
+
 -- Comments for documentation
-COMMENT ON TABLE {schema}.game_logs IS 'NBA team game log data with boxscore linking';
-COMMENT ON COLUMN {schema}.game_logs.boxscore_id IS 'Unique identifier for linking to boxscore details (basketball-reference format)';
-COMMENT ON COLUMN {schema}.game_logs.fg_pct IS 'Field goal percentage (0.000-1.000)';
-COMMENT ON COLUMN {schema}.game_logs.fg3_pct IS 'Three-point field goal percentage (0.000-1.000)';
-COMMENT ON COLUMN {schema}.game_logs.ft_pct IS 'Free throw percentage (0.000-1.000)';
-COMMENT ON INDEX {schema}.idx_nba_game_logs_boxscore_id IS 'Primary linking key for boxscore-related tables';
-COMMENT ON VIEW {schema}.game_summary IS 'Simplified view of NBA game results for quick analysis';
-"""
-        return sql
-    
-    def create_nhl_schema(self, schema: str = "nhl") -> str:
-        """
-        Generate CREATE TABLE SQL for NHL game log data.
-        
-        NHL games have hockey-specific statistics:
-        - Goals, assists, points
-        - Shots on goal, saves, save percentage
-        - Power play opportunities
-        - Penalty minutes
-        - Face-off wins
-        """
-        sql = f"""
+COMMENT ON TABLE ${schema}.game_logs IS 'NBA team game log data with boxscore linking';
+COMMENT ON COLUMN ${schema}.game_logs.boxscore_id IS 'Unique identifier for linking to boxscore details (basketball-reference format)';
+COMMENT ON COLUMN ${schema}.game_logs.fg_pct IS 'Field goal percentage (0.000-1.000)';
+COMMENT ON COLUMN ${schema}.game_logs.fg3_pct IS 'Three-point field goal percentage (0.000-1.000)';
+COMMENT ON COLUMN ${schema}.game_logs.ft_pct IS 'Free throw percentage (0.000-1.000)';
+COMMENT ON TABLE ${schema}.game_logs_urls IS 'Boxscore URLs for NBA game logs, keyed by boxscore_id';
+COMMENT ON VIEW ${schema}.game_summary IS 'Simplified view of NBA game results for quick analysis';
+""")
+
+# Index DDL is kept apart from the table DDL: CREATE INDEX CONCURRENTLY cannot
+# run inside a transaction block, so each statement is sent on its own.
+_NBA_INDEX_TEMPLATES = tuple(Template(sql) for sql in (
+    "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_nba_game_logs_boxscore_id ON ${schema}.game_logs(boxscore_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nba_game_logs_team_season ON ${schema}.game_logs(team, season)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nba_game_logs_date ON ${schema}.game_logs(date)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nba_game_logs_opponent ON ${schema}.game_logs(opponent)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nba_game_logs_home_team ON ${schema}.game_logs(boxscore_home_team)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nba_game_logs_result ON ${schema}.game_logs(result)",
+    "COMMENT ON INDEX ${schema}.idx_nba_game_logs_boxscore_id IS 'Primary linking key for boxscore-related tables'",
+    "ANALYZE ${schema}.game_logs",
+))
+
+_NHL_SCHEMA_TEMPLATE = Template("""
 -- Create schema if it doesn't exist
-CREATE SCHEMA IF NOT EXISTS {schema};
+CREATE SCHEMA IF NOT EXISTS ${schema};
 
 -- Create NHL game log table with hockey-specific statistics
-CREATE TABLE IF NOT EXISTS {schema}.game_logs (
+CREATE TABLE IF NOT EXISTS ${schema}.game_logs (
     id SERIAL PRIMARY KEY,
     
     -- Unique game identifier (critical for linking tables)
     boxscore_id VARCHAR(20) UNIQUE NOT NULL,
-    boxscore_url TEXT,
     boxscore_date DATE,
     boxscore_game_number INTEGER DEFAULT 0,
     boxscore_home_team VARCHAR(4),
@@ -341,23 +282,22 @@ CREATE TABLE IF NOT EXISTS {schema}.game_logs (
     CONSTRAINT nhl_game_logs_scores_non_negative CHECK (team_score >= 0 AND opp_score >= 0)
 );
 
--- Critical indexes for performance and linking
-CREATE UNIQUE INDEX IF NOT EXISTS idx_nhl_game_logs_boxscore_id ON {schema}.game_logs(boxscore_id);
-CREATE INDEX IF NOT EXISTS idx_nhl_game_logs_team_season ON {schema}.game_logs(team, season);
-CREATE INDEX IF NOT EXISTS idx_nhl_game_logs_date ON {schema}.game_logs(date);
-CREATE INDEX IF NOT EXISTS idx_nhl_game_logs_opponent ON {schema}.game_logs(opponent);
-CREATE INDEX IF NOT EXISTS idx_nhl_game_logs_home_team ON {schema}.game_logs(boxscore_home_team);
-CREATE INDEX IF NOT EXISTS idx_nhl_game_logs_result ON {schema}.game_logs(result);
+-- Boxscore URLs live in a 1:1 side table so game_logs rows stay narrow for analytic scans
+CREATE TABLE IF NOT EXISTS ${schema}.game_logs_urls (
+    boxscore_id VARCHAR(20) PRIMARY KEY
+        REFERENCES ${schema}.game_logs(boxscore_id) ON DELETE CASCADE,
+    boxscore_url TEXT
+);
 
 -- Create update trigger for updated_at
-DROP TRIGGER IF EXISTS update_nhl_game_logs_modtime ON {schema}.game_logs;
+DROP TRIGGER IF EXISTS update_nhl_game_logs_modtime ON ${schema}.game_logs;
 CREATE TRIGGER update_nhl_game_logs_modtime
-    BEFORE UPDATE ON {schema}.game_logs
+    BEFORE UPDATE ON ${schema}.game_logs
     FOR EACH ROW
     EXECUTE FUNCTION update_modified_column();
 
 -- Create a view for easy game analysis
-CREATE OR REPLACE VIEW {schema}.game_summary AS
+CREATE OR REPLACE VIEW ${schema}.game_summary AS
 SELECT 
     boxscore_id,
     date,
@@ -380,19 +320,155 @@ SELECT
     CASE WHEN overtime THEN 'OT' 
          WHEN shootout THEN 'SO' 
          ELSE 'REG' END AS game_type,
-    boxscore_url
-FROM {schema}.game_logs
+    u.boxscore_url
+FROM ${schema}.game_logs
+LEFT JOIN ${schema}.game_logs_urls u USING (boxscore_id)
 ORDER BY date, boxscore_id;
 
+-- Databases created before game_logs_urls kept the URL on game_logs: copy it
+-- across once, then drop the old column (after the view above stops using it).
+-- (The doubled dollar quotes are string.Template escapes.)
+DO $$$$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = '${schema}' AND table_name = 'game_logs' AND column_name = 'boxscore_url'
+    ) THEN
+        INSERT INTO ${schema}.game_logs_urls (boxscore_id, boxscore_url)
+        SELECT boxscore_id, boxscore_url FROM ${schema}.game_logs
+        WHERE boxscore_id IS NOT NULL AND boxscore_url IS NOT NULL
+        ON CONFLICT DO NOTHING;
+        ALTER TABLE ${schema}.game_logs DROP COLUMN IF EXISTS boxscore_url;
+    END IF;
+END
+$$$$;
+
 -- Comments for documentation
-COMMENT ON TABLE {schema}.game_logs IS 'NHL team game log data with boxscore linking';
-COMMENT ON COLUMN {schema}.game_logs.boxscore_id IS 'Unique identifier for linking to boxscore details (hockey-reference format)';
-COMMENT ON COLUMN {schema}.game_logs.result IS 'Game result: W=Win, L=Loss, OTL=Overtime Loss, SOL=Shootout Loss';
-COMMENT ON COLUMN {schema}.game_logs.plus_minus IS 'Team plus/minus rating for the game';
-COMMENT ON INDEX {schema}.idx_nhl_game_logs_boxscore_id IS 'Primary linking key for boxscore-related tables';
-COMMENT ON VIEW {schema}.game_summary IS 'Simplified view of NHL game results for quick analysis';
-"""
-        return sql
+COMMENT ON TABLE ${schema}.game_logs IS 'NHL team game log data with boxscore linking';
+COMMENT ON COLUMN ${schema}.game_logs.boxscore_id IS 'Unique identifier for linking to boxscore details (hockey-reference format)';
+COMMENT ON COLUMN ${schema}.game_logs.result IS 'Game result: W=Win, L=Loss, OTL=Overtime Loss, SOL=Shootout Loss';
+COMMENT ON COLUMN ${schema}.game_logs.plus_minus IS 'Team plus/minus rating for the game';
+COMMENT ON TABLE ${schema}.game_logs_urls IS 'Boxscore URLs for NHL game logs, keyed by boxscore_id';
+COMMENT ON VIEW ${schema}.game_summary IS 'Simplified view of NHL game results for quick analysis';
+""")
+
+# Index DDL is kept apart from the table DDL: CREATE INDEX CONCURRENTLY cannot
+# run inside a transaction block, so each statement is sent on its own.
+_NHL_INDEX_TEMPLATES = tuple(Template(sql) for sql in (
+    "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_nhl_game_logs_boxscore_id ON ${schema}.game_logs(boxscore_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nhl_game_logs_team_season ON ${schema}.game_logs(team, season)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nhl_game_logs_date ON ${schema}.game_logs(date)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nhl_game_logs_opponent ON ${schema}.game_logs(opponent)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nhl_game_logs_home_team ON ${schema}.game_logs(boxscore_home_team)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nhl_game_logs_result ON ${schema}.game_logs(result)",
+    "COMMENT ON INDEX ${schema}.idx_nhl_game_logs_boxscore_id IS 'Primary linking key for boxscore-related tables'",
+    "ANALYZE ${schema}.game_logs",
+))
+
+
+class MultiSportDatabaseManager:
+    """
+    Unified database manager for all sports in the All Sports Reference system.
+    """
+    
+    SPORTS_CONFIGS = MappingProxyType({
+        'nfl': SportConfig(
+            name='nfl',
+            display_name='NFL',
+            schema_name='nfl',
+            primary_table='game_logs',
+            boxscore_table='boxscore_details',
+            has_boxscores=True,
+            has_playoffs=True,
+            season_structure='fall'
+        ),
+        'nba': SportConfig(
+            name='nba',
+            display_name='NBA',
+            schema_name='nba',
+            primary_table='game_logs',
+            boxscore_table='boxscore_details',
+            has_boxscores=True,
+            has_playoffs=True,
+            season_structure='winter'
+        ),
+        'nhl': SportConfig(
+            name='nhl',
+            display_name='NHL',
+            schema_name='nhl',
+            primary_table='game_logs',
+            boxscore_table='boxscore_details',
+            has_boxscores=True,
+            has_playoffs=True,
+            season_structure='winter'
+        ),
+        'ncaaf': SportConfig(
+            name='ncaaf',
+            display_name='NCAA Football',
+            schema_name='ncaaf',
+            primary_table='game_logs',
+            boxscore_table='boxscore_details',
+            has_boxscores=True,
+            has_playoffs=True,
+            season_structure='fall'
+        ),
+        'ncaab': SportConfig(
+            name='ncaab',
+            display_name='NCAA Basketball',
+            schema_name='ncaab',
+            primary_table='game_logs',
+            boxscore_table='boxscore_details',
+            has_boxscores=True,
+            has_playoffs=True,
+            season_structure='winter'
+        )
+    })
+    
+    def __init__(self):
+        """Initialize the multi-sport database manager."""
+        self.sports_configs = self.SPORTS_CONFIGS
+    
+    def get_sport_config(self, sport: str) -> SportConfig:
+        """Get configuration for a specific sport."""
+        if sport.lower() not in self.sports_configs:
+            raise ValueError(f"Unsupported sport: {sport}. Available: {list(self.sports_configs.keys())}")
+        return self.sports_configs[sport.lower()]
+    
+    def list_sports(self) -> List[SportConfig]:
+        """List all configured sports."""
+        return list(self.sports_configs.values())
+    
+    def create_nba_schema(self, schema: str = "nba") -> str:
+        """
+        Generate CREATE TABLE SQL for NBA game log data.
+        
+        NBA games have different statistics compared to NFL:
+        - Points, rebounds, assists instead of passing/rushing yards
+        - Field goals, three-pointers, free throws
+        - Different game structure (4 quarters vs 4 quarters + OT)
+        """
+        return _NBA_SCHEMA_TEMPLATE.substitute(schema=schema)
+    
+    def create_nhl_schema(self, schema: str = "nhl") -> str:
+        """
+        Generate CREATE TABLE SQL for NHL game log data.
+        
+        NHL games have hockey-specific statistics:
+        - Goals, assists, points
+        - Shots on goal, saves, save percentage
+        - Power play opportunities
+        - Penalty minutes
+        - Face-off wins
+        """
+        return _NHL_SCHEMA_TEMPLATE.substitute(schema=schema)
+    
+    def create_nba_indexes(self, schema: str = "nba") -> List[str]:
+        """Generate the NBA game log index statements, ending with ANALYZE."""
+        return [template.substitute(schema=schema) for template in _NBA_INDEX_TEMPLATES]
+    
+    def create_nhl_indexes(self, schema: str = "nhl") -> List[str]:
+        """Generate the NHL game log index statements, ending with ANALYZE."""
+        return [template.substitute(schema=schema) for template in _NHL_INDEX_TEMPLATES]
     
     def create_sport_schema(self, sport: str) -> str:
         """
@@ -430,6 +506,29 @@ COMMENT ON VIEW {schema}.game_summary IS 'Simplified view of NHL game results fo
         else:
             raise ValueError(f"Schema generation not implemented for sport: {sport}")
     
+    def create_sport_indexes(self, sport: str) -> List[str]:
+        """
+        Get the index statements to run after a sport's schema DDL.
+        
+        Parameters
+        ----------
+        sport : str
+            Sport name (nfl, nba, nhl, etc.)
+            
+        Returns
+        -------
+        List[str]
+            Individual statements, each of which must be executed outside a
+            transaction block. Empty for sports whose DDL builds its own indexes.
+        """
+        config = self.get_sport_config(sport)
+        
+        if sport.lower() in ['nba', 'ncaab']:
+            return self.create_nba_indexes(config.schema_name)
+        elif sport.lower() == 'nhl':
+            return self.create_nhl_indexes(config.schema_name)
+        return []
+    
     def setup_sport_database(self, sport: str) -> bool:
         """
         Setup database schema for a specific sport.
@@ -454,6 +553,29 @@ COMMENT ON VIEW {schema}.game_summary IS 'Simplified view of NHL game results fo
             # Execute the schema creation
             with PostgreSQLManager() as db:
                 db.execute_sql(schema_sql)
+                
+                # Build indexes concurrently so re-runs never lock out readers
+                # (returning the connection to the pool switches autocommit back off)
+                db._connection.autocommit = True
+                index_statements = self.create_sport_indexes(sport)
+                if index_statements:
+                    # A failed concurrent build leaves an INVALID index behind, which
+                    # IF NOT EXISTS would then skip forever, so drop it to be rebuilt
+                    invalid_indexes = db.fetch_all(
+                        """
+                        SELECT format('%%I.%%I', n.nspname, c.relname)
+                        FROM pg_index i
+                        JOIN pg_class c ON c.oid = i.indexrelid
+                        JOIN pg_namespace n ON n.oid = c.relnamespace
+                        WHERE n.nspname = %s AND NOT i.indisvalid
+                        """,
+                        (config.schema_name,)
+                    )
+                    for (index_name,) in invalid_indexes:
+                        logger.warning(f"⚠️  Rebuilding invalid index {index_name}")
+                        db.execute_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+                for index_sql in index_statements:
+                    db.execute_sql(index_sql)
             
             logger.info(f"✅ {config.display_name} schema created successfully!")
             return True
@@ -18,14 +18,21 @@ The data is stored in new database tables linked by boxscore_id for advanced ana
 
 import sys
 import os
+import io
+import csv
+import gzip
+import contextlib
+import functools
 import logging
-from bs4 import BeautifulSoup, Comment
-import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+import re
 import time
-import random
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -38,7 +45,7 @@ load_dotenv(env_path, override=True)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
 
 from src.nfl.database import PostgreSQLManager
-from src.utils.common import _curl_page, export_dataframe_to_csv
+from src.utils.common import _curl_page, generate_export_filename
 
 # Configure logging
 logging.basicConfig(
@@ -48,7 +55,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# BeautifulSoup tree builder for boxscore pages (C-based libxml2)
+_PARSER = 'lxml'
+
+# Sports-reference hides most stat tables inside HTML comments
+_COMMENT_RE = re.compile(r'<!--(.*?)-->', re.DOTALL)
+
+# XPath expressions compiled once at import rather than on every lookup
+_X_TABLE_BY_ID = etree.XPath('.//table[@id=$table_id]')
+_X_CELLS = etree.XPath('./td|./th')
+_X_TEAM_STAT_ROWS = etree.XPath('(.//tr)[position() > 1][count(td|th) >= 3]')
+_X_BODY_ROWS = etree.XPath('(.//tbody)[1]//tr')
+
+
+def _unwrap_commented_tables(html_content: str) -> str:
+    """Strip comment markers around tables so one parser pass sees every table"""
+    return _COMMENT_RE.sub(
+        lambda match: match.group(1) if '<table' in match.group(1) else match.group(0),
+        html_content
+    )
+
+@dataclass(slots=True)
 class BoxscorePlayerStats:
     """Player-level statistics from boxscore"""
     boxscore_id: str
@@ -89,7 +116,7 @@ class BoxscorePlayerStats:
     def_ff: Optional[int] = None
     def_fr: Optional[int] = None
 
-@dataclass 
+@dataclass(slots=True)
 class BoxscoreTeamStats:
     """Team-level advanced statistics"""
     boxscore_id: str
@@ -110,7 +137,7 @@ class BoxscoreTeamStats:
     fourth_down_conversions: Optional[str] = None
     red_zone_conversions: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class BoxscoreScoring:
     """Scoring events from the game"""
     boxscore_id: str
@@ -121,7 +148,7 @@ class BoxscoreScoring:
     score_home: int
     score_away: int
 
-@dataclass
+@dataclass(slots=True)
 class BoxscoreDrive:
     """Drive summary data"""
     boxscore_id: str
@@ -134,122 +161,316 @@ class BoxscoreDrive:
     yards: int
     result: str
 
+# Pre-parsed values for the blanks and small numbers that make up most stat cells
+_INT_CACHE: Dict[str, Optional[int]] = {'': None, '--': None, **{str(i): i for i in range(-10, 200)}}
+_FLOAT_CACHE: Dict[str, Optional[float]] = {
+    '': None, '--': None,
+    **{str(i): float(i) for i in range(10)},
+    **{str(v): v for v in (0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0)},
+}
+_MISSING = object()
+
+# Column order of the rows built in save_boxscore_data, used by the COPY and prepared-insert paths
+PLAYER_STATS_COLUMNS = (
+    'boxscore_id', 'player_name', 'team', 'pass_cmp', 'pass_att', 'pass_yds',
+    'pass_td', 'pass_int', 'rush_att', 'rush_yds', 'rush_td', 'rec_tgt',
+    'rec_rec', 'rec_yds', 'rec_td', 'def_tackles', 'def_assists', 'def_sacks',
+)
+TEAM_STATS_COLUMNS = (
+    'boxscore_id', 'team', 'first_downs', 'total_yards', 'passing_yards',
+    'rushing_yards', 'turnovers', 'penalties', 'penalty_yards',
+    'time_of_possession', 'third_down_conversions', 'fourth_down_conversions',
+)
+SCORING_COLUMNS = (
+    'boxscore_id', 'quarter', 'time_remaining', 'team', 'description',
+    'score_home', 'score_away',
+)
+
+# Prepared upsert name -> (table, columns, conflict target, array type per column) for
+# save_boxscore_data; each statement takes one array per column and UNNESTs them
+PREPARED_INSERTS = {
+    'ins_boxscore_player': (
+        'nfl.boxscore_player_stats', PLAYER_STATS_COLUMNS, ('boxscore_id', 'player_name', 'team'),
+        ('text[]',) * 3 + ('int[]',) * 14 + ('numeric[]',),
+    ),
+    'ins_boxscore_team': (
+        'nfl.boxscore_team_stats', TEAM_STATS_COLUMNS, ('boxscore_id', 'team'),
+        ('text[]',) * 2 + ('int[]',) * 7 + ('text[]',) * 3,
+    ),
+}
+
+def _on_conflict_clause(table: str, columns: Tuple[str, ...], conflict_columns: Tuple[str, ...]) -> str:
+    """Build an ON CONFLICT ... DO UPDATE clause that overwrites every non-key column
+    
+    Rows whose values are all unchanged are skipped, so re-scraping a game
+    writes no new row versions or WAL for it.
+    """
+    if not conflict_columns:
+        return ""
+    target = table.split('.')[-1]
+    value_columns = [column for column in columns if column not in conflict_columns]
+    updates = ', '.join(f"{column} = EXCLUDED.{column}" for column in value_columns)
+    current = ', '.join(f"{target}.{column}" for column in value_columns)
+    incoming = ', '.join(f"EXCLUDED.{column}" for column in value_columns)
+    return (f" ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {updates}"
+            f" WHERE ({current}) IS DISTINCT FROM ({incoming})")
+
+# Game log boxscores with no player stats saved yet, used by get_available_boxscore_ids
+_SQL_IDS_TEMPLATE = """
+    SELECT gl.boxscore_id 
+    FROM nfl.game_logs gl
+    WHERE gl.boxscore_id IS NOT NULL 
+    AND gl.boxscore_id <> ''
+    AND NOT EXISTS (
+        SELECT 1 FROM nfl.boxscore_player_stats bps
+        WHERE bps.boxscore_id = gl.boxscore_id
+    )
+    {season_filter}
+    ORDER BY gl.boxscore_id DESC
+    LIMIT %s
+"""
+_SQL_IDS_ALL = _SQL_IDS_TEMPLATE.format(season_filter="")
+_SQL_IDS_SEASON = _SQL_IDS_TEMPLATE.format(season_filter="AND gl.season = %s")
+
+# Team stat rows mapped to BoxscoreTeamStats fields; True marks integer-valued rows
+TEAM_STAT_SPEC: Dict[str, Tuple[str, bool]] = {
+    'First Downs': ('first_downs', True),
+    'Total Yards': ('total_yards', True),
+    'Net Pass Yards': ('passing_yards', True),
+    'Turnovers': ('turnovers', True),
+    'Time of Possession': ('time_of_possession', False),
+    'Third Down Conv.': ('third_down_conversions', False),
+    'Fourth Down Conv.': ('fourth_down_conversions', False),
+}
+
+class TokenBucket:
+    """Thread-safe token bucket that spaces requests across all fetch workers"""
+    
+    def __init__(self, max_rate: float, time_period: float, capacity: int = 1):
+        self.rate = max_rate / time_period
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# One request budget for pro-football-reference.com, shared by every scraper and worker
+PFR_RATE_LIMITER = TokenBucket(max_rate=float(os.getenv('PFR_REQUESTS_PER_MINUTE', '10')), time_period=60)
+
 class NFLBoxscoreScraper:
     """Scraper for detailed NFL boxscore data from pro-football-reference.com"""
     
-    def __init__(self):
+    # Seconds a get_available_boxscore_ids result is reused before re-querying
+    BOXSCORE_IDS_TTL = 300
+    
+    def __init__(self, bulk_load: bool = False, db: Optional[PostgreSQLManager] = None):
         self.base_url = "https://www.pro-football-reference.com/boxscores/"
-        self.db = PostgreSQLManager()
+        # Callers may hand in a manager so one connection serves the whole run
+        self.db = db if db is not None else PostgreSQLManager()
+        self.rate_limiter = PFR_RATE_LIMITER
+        # Save through COPY staging tables by default (for large backfills)
+        self.bulk_load = bulk_load
+        self._boxscore_ids_cache: Dict[Tuple[Optional[int], Optional[int]], Tuple[float, List[str]]] = {}
+        # Connection the PREPARED_INSERTS statements were last prepared on
+        self._prepared_connection = None
+        # Raw pages are cached gzipped on disk so re-runs skip the network
+        # Override with BOXSCORE_CACHE to share one cache between checkouts
+        self.cache_dir = Path(os.getenv('BOXSCORE_CACHE', script_dir / '.cache' / 'pfr_boxscores'))
         
+    def _get_connection(self):
+        """Return the scraper's shared database connection, opening it on first use"""
+        if not self.db._connection:
+            self.db.connect()
+        return self.db._connection
+    
+    def close(self):
+        """Close the shared database connection"""
+        self.db.disconnect()
+        self._prepared_connection = None
+    
     def get_boxscore_url(self, boxscore_id: str) -> str:
         """Generate the full URL for a boxscore ID"""
         return f"{self.base_url}{boxscore_id}.htm"
     
-    def fetch_boxscore_html(self, boxscore_id: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse the boxscore HTML using pycurl"""
+    def fetch_boxscore_page(self, boxscore_id: str, force_refetch: bool = False) -> Optional[str]:
+        """Fetch the raw boxscore HTML, from the disk cache when available or else using pycurl"""
+        cache_file = self.cache_dir / f"{boxscore_id}.html.gz"
+        if cache_file.exists() and not force_refetch:
+            logger.info(f"📦 Using cached boxscore: {boxscore_id}")
+            return gzip.decompress(cache_file.read_bytes()).decode('utf-8')
+        
         url = self.get_boxscore_url(boxscore_id)
         
         try:
             logger.info(f"🌐 Fetching boxscore: {boxscore_id}")
             
-            # Add random delay to be respectful
-            time.sleep(random.uniform(1, 3))
+            # Wait for the shared rate limiter to be respectful
+            self.rate_limiter.acquire()
             
             # Use pycurl via the existing utility function
             html_content = _curl_page(url=url)
             
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract content from HTML comments (common in sports-reference sites)
-            comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-            for comment in comments:
-                try:
-                    comment_soup = BeautifulSoup(comment, 'html.parser')
-                    # Replace the comment with parsed content
-                    comment.replace_with(comment_soup)
-                except:
-                    continue
+            # Only cache pages that look like a complete boxscore, since cache entries never expire
+            if 'id="scoring"' in html_content:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(gzip.compress(html_content.encode('utf-8')))
+            else:
+                logger.warning(f"⚠️ Boxscore {boxscore_id} has no scoring table, not caching it")
             
             logger.info(f"✅ Successfully fetched boxscore: {boxscore_id}")
-            return soup
+            return html_content
             
         except Exception as e:
             logger.error(f"❌ Error fetching boxscore {boxscore_id}: {e}")
             return None
     
-    def extract_team_stats(self, soup: BeautifulSoup, boxscore_id: str) -> List[BoxscoreTeamStats]:
-        """Extract team-level statistics from HTML comments"""
+    def fetch_boxscore_pages(self, boxscore_ids: List[str], max_workers: int = 4) -> Dict[str, Optional[str]]:
+        """Fetch several boxscore pages concurrently
+        
+        Every worker draws from the shared rate limiter in fetch_boxscore_page, so
+        concurrency overlaps network waits without exceeding the request budget.
+        """
+        logger.info(f"🌐 Fetching {len(boxscore_ids)} boxscores with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(self.fetch_boxscore_page, boxscore_ids)
+            return dict(zip(boxscore_ids, pages))
+    
+    def fetch_boxscore_html(self, boxscore_id: str, force_refetch: bool = False,
+                            table_ids: Optional[Iterable[str]] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse the boxscore HTML into a BeautifulSoup (only the given tables if table_ids is set)"""
+        html_content = self.fetch_boxscore_page(boxscore_id, force_refetch=force_refetch)
+        if html_content is None:
+            return None
+        
+        try:
+            return self.parse_boxscore_soup(html_content, table_ids=table_ids)
+            
+        except Exception as e:
+            logger.error(f"❌ Error parsing boxscore {boxscore_id}: {e}")
+            return None
+    
+    def parse_boxscore_soup(self, html_content: str, table_ids: Optional[Iterable[str]] = None) -> BeautifulSoup:
+        """Parse boxscore HTML into a BeautifulSoup with every commented-out table unwrapped
+        
+        Callers that only read a few tables can pass their ids in table_ids; the rest
+        of the page (navigation, ads, wrapper divs) is then never built.
+        """
+        parse_only = None
+        if table_ids is not None:
+            wanted = frozenset(table_ids)
+            parse_only = SoupStrainer('table', id=lambda table_id: table_id in wanted)
+        return BeautifulSoup(_unwrap_commented_tables(html_content), _PARSER, parse_only=parse_only)
+    
+    def parse_boxscore_tree(self, html_content: str) -> lxml_html.HtmlElement:
+        """Parse boxscore HTML into an lxml tree; commented-out tables are unwrapped on demand by _find_table"""
+        return lxml_html.fromstring(html_content)
+    
+    def _find_table(self, tree, table_id: str):
+        """Find a table by id, unwrapping only the HTML comment that hides it when it isn't in the live tree"""
+        tables = _X_TABLE_BY_ID(tree, table_id=table_id)
+        if tables:
+            return tables[0]
+        
+        marker = f'id="{table_id}"'
+        for comment in tree.iter(etree.Comment):
+            if comment.text and marker in comment.text and comment.getparent() is not None:
+                # Splice the parsed markup in place of the comment so later lookups find it directly
+                wrapper = lxml_html.fragment_fromstring(comment.text, create_parent='div')
+                wrapper.tail = comment.tail
+                comment.getparent().replace(comment, wrapper)
+                tables = _X_TABLE_BY_ID(wrapper, table_id=table_id)
+                if tables:
+                    return tables[0]
+        
+        return None
+    
+    def _as_tree(self, soup) -> lxml_html.HtmlElement:
+        """Return an lxml tree for either an lxml tree or a BeautifulSoup document"""
+        if isinstance(soup, BeautifulSoup):
+            return lxml_html.fromstring(str(soup))
+        return soup
+    
+    @staticmethod
+    def _text(node) -> str:
+        """Concatenate a node's stripped text fragments, like get_text(strip=True)"""
+        return ''.join(fragment.strip() for fragment in node.itertext())
+    
+    def extract_team_stats(self, soup, boxscore_id: str) -> List[BoxscoreTeamStats]:
+        """Extract team-level statistics"""
         team_stats = []
         
         try:
-            # Team stats are in HTML comments
-            comments = soup.find_all(string=lambda text: isinstance(text, Comment))
+            tree = self._as_tree(soup)
+            
+            # Team stats are usually hidden in an HTML comment
+            team_stats_table = self._find_table(tree, 'team_stats')
+            
+            if team_stats_table is not None:
+                # Get team names from header row
+                header_row = team_stats_table.find('.//tr')
+                if header_row is not None:
+                    header_cells = _X_CELLS(header_row)
+                    if len(header_cells) >= 3:
+                        # Team codes recur across every game, so share one string each
+                        team1 = sys.intern(self._text(header_cells[1]))
+                        team2 = sys.intern(self._text(header_cells[2]))
+                
+                # Parse each stat row
+                stats_data = {team1: {}, team2: {}}
+                
+                # Skip the header and keep only rows with at least three cells in one XPath pass
+                for row in _X_TEAM_STAT_ROWS(team_stats_table):
+                    cells = _X_CELLS(row)
+                    stat_name, team1_value, team2_value = (self._text(cell) for cell in cells[:3])
+                    stat_name = sys.intern(stat_name)
+                    stats_data[team1][stat_name] = team1_value
+                    stats_data[team2][stat_name] = team2_value
+                
+                # Create BoxscoreTeamStats objects for both teams
+                for team in [team1, team2]:
+                    data = stats_data[team]
+                
+                    # Parse rushing yards from "Rush-Yds-TDs" format
+                    rushing_yards = None
+                    if "Rush-Yds-TDs" in data:
+                        rush_parts = data["Rush-Yds-TDs"].split('-')
+                        if len(rush_parts) >= 2:
+                            rushing_yards = self._safe_int(rush_parts[1])
+                
+                    # Parse penalties from "Penalties-Yards" format  
+                    penalties = None
+                    penalty_yards = None
+                    if "Penalties-Yards" in data:
+                        pen_parts = data["Penalties-Yards"].split('-')
+                        if len(pen_parts) >= 2:
+                            penalties = self._safe_int(pen_parts[0])
+                            penalty_yards = self._safe_int(pen_parts[1])
+                
+                    team_stat = BoxscoreTeamStats(
+                        boxscore_id=boxscore_id,
+                        team=team,
+                        rushing_yards=rushing_yards,
+                        penalties=penalties,
+                        penalty_yards=penalty_yards,
+                        **{
+                            field: self._safe_int(data.get(stat_name)) if is_int else data.get(stat_name)
+                            for stat_name, (field, is_int) in TEAM_STAT_SPEC.items()
+                        }
+                    )
+                    team_stats.append(team_stat)
             
-            for comment in comments:
-                if 'team_stats' in comment:
-                    comment_soup = BeautifulSoup(comment, 'html.parser')
-                    team_stats_table = comment_soup.find('table', {'id': 'team_stats'})
-                    
-                    if team_stats_table:
-                        # Get team names from header row
-                        header_row = team_stats_table.find('tr')
-                        if header_row:
-                            header_cells = header_row.find_all(['th', 'td'])
-                            if len(header_cells) >= 3:
-                                team1 = header_cells[1].get_text(strip=True)
-                                team2 = header_cells[2].get_text(strip=True)
-                        
-                        # Parse each stat row
-                        stats_data = {team1: {}, team2: {}}
-                        rows = team_stats_table.find_all('tr')[1:]  # Skip header
-                        
-                        for row in rows:
-                            cells = row.find_all(['td', 'th'])
-                            if len(cells) >= 3:
-                                stat_name = cells[0].get_text(strip=True)
-                                team1_value = cells[1].get_text(strip=True)
-                                team2_value = cells[2].get_text(strip=True)
-                                
-                                stats_data[team1][stat_name] = team1_value
-                                stats_data[team2][stat_name] = team2_value
-                        
-                        # Create BoxscoreTeamStats objects for both teams
-                        for team in [team1, team2]:
-                            data = stats_data[team]
-                            
-                            # Parse rushing yards from "Rush-Yds-TDs" format
-                            rushing_yards = None
-                            if "Rush-Yds-TDs" in data:
-                                rush_parts = data["Rush-Yds-TDs"].split('-')
-                                if len(rush_parts) >= 2:
-                                    rushing_yards = self._safe_int(rush_parts[1])
-                            
-                            # Parse penalties from "Penalties-Yards" format  
-                            penalties = None
-                            penalty_yards = None
-                            if "Penalties-Yards" in data:
-                                pen_parts = data["Penalties-Yards"].split('-')
-                                if len(pen_parts) >= 2:
-                                    penalties = self._safe_int(pen_parts[0])
-                                    penalty_yards = self._safe_int(pen_parts[1])
-                            
-                            team_stat = BoxscoreTeamStats(
-                                boxscore_id=boxscore_id,
-                                team=team,
-                                first_downs=self._safe_int(data.get('First Downs')),
-                                total_yards=self._safe_int(data.get('Total Yards')),
-                                passing_yards=self._safe_int(data.get('Net Pass Yards')),
-                                rushing_yards=rushing_yards,
-                                turnovers=self._safe_int(data.get('Turnovers')),
-                                penalties=penalties,
-                                penalty_yards=penalty_yards,
-                                time_of_possession=data.get('Time of Possession'),
-                                third_down_conversions=data.get('Third Down Conv.'),
-                                fourth_down_conversions=data.get('Fourth Down Conv.'),
-                            )
-                            team_stats.append(team_stat)
-                        break
-                        
             logger.info(f"📊 Extracted team stats for {len(team_stats)} teams")
             
         except Exception as e:
@@ -257,135 +478,153 @@ class NFLBoxscoreScraper:
         
         return team_stats
     
-    def extract_player_stats(self, soup: BeautifulSoup, boxscore_id: str) -> List[BoxscorePlayerStats]:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _compute_col_indices(headers_tuple: Tuple[str, ...]) -> Dict[str, int]:
+        """Map player_offense stat fields to column positions for a header row"""
+        # Find column indices for stats we want
+        col_indices = {}
+        for i, header in enumerate(headers_tuple):
+            if header == 'Player':
+                col_indices['player'] = i
+            elif header == 'Tm':
+                col_indices['team'] = i
+            elif header == 'Cmp':
+                col_indices['pass_cmp'] = i
+            elif header == 'Att' and 'pass_att' not in col_indices:
+                col_indices['pass_att'] = i
+            elif header == 'Yds' and 'pass_yds' not in col_indices:
+                col_indices['pass_yds'] = i
+            elif header == 'TD' and 'pass_td' not in col_indices:
+                col_indices['pass_td'] = i
+            elif header == 'Int':
+                col_indices['pass_int'] = i
+        
+        # Find rushing and receiving column indices (they appear after passing)
+        passing_end = max([v for k, v in col_indices.items() if 'pass' in k], default=0)
+        
+        for i in range(passing_end + 1, len(headers_tuple)):
+            header = headers_tuple[i]
+            if header == 'Att' and 'rush_att' not in col_indices:
+                col_indices['rush_att'] = i
+            elif header == 'Yds' and 'rush_yds' not in col_indices:
+                col_indices['rush_yds'] = i
+            elif header == 'TD' and 'rush_td' not in col_indices:
+                col_indices['rush_td'] = i
+            elif header == 'Rec':
+                col_indices['rec_rec'] = i
+            elif header == 'Yds' and 'rec_yds' not in col_indices and 'rec_rec' in col_indices:
+                col_indices['rec_yds'] = i
+            elif header == 'TD' and 'rec_td' not in col_indices and 'rec_rec' in col_indices:
+                col_indices['rec_td'] = i
+            elif header == 'Tgt':
+                col_indices['rec_tgt'] = i
+        
+        return col_indices
+    
+    def extract_player_stats(self, soup, boxscore_id: str) -> List[BoxscorePlayerStats]:
         """Extract player-level statistics"""
+        player_stats = [
+            BoxscorePlayerStats(**dict(zip(PLAYER_STATS_COLUMNS, row)))
+            for row in self._player_stat_rows(soup, boxscore_id)
+        ]
+        logger.info(f"👥 Extracted stats for {len(player_stats)} players")
+        return player_stats
+    
+    def extract_player_stats_df(self, soup, boxscore_id: str):
+        """Extract player-level statistics as a DataFrame with nullable integer columns"""
+        import pandas as pd
+        
+        player_df = pd.DataFrame.from_records(self._player_stat_rows(soup, boxscore_id),
+                                              columns=PLAYER_STATS_COLUMNS)
+        return player_df.astype({
+            column: 'Float32' if column == 'def_sacks' else 'Int16'
+            for column in PLAYER_STATS_COLUMNS[3:]
+        })
+    
+    def _player_stat_rows(self, soup, boxscore_id: str) -> List[Tuple]:
+        """Extract player offense rows as tuples in PLAYER_STATS_COLUMNS order"""
         player_stats = []
         
         try:
+            tree = self._as_tree(soup)
+            
             # Find the player offense table
-            player_table = soup.find('table', {'id': 'player_offense'})
-            if not player_table:
+            player_table = self._find_table(tree, 'player_offense')
+            if player_table is None:
                 logger.warning(f"⚠️  No player_offense table found for {boxscore_id}")
                 return player_stats
             
             # Get headers to understand column positions
-            headers = player_table.find('thead')
-            if not headers:
+            headers = player_table.find('.//thead')
+            if headers is None:
                 return player_stats
                 
-            header_cells = headers.find_all('th')
-            header_text = [th.get_text(strip=True) for th in header_cells]
-            
-            # Find column indices for stats we want
-            col_indices = {}
-            for i, header in enumerate(header_text):
-                if header == 'Player':
-                    col_indices['player'] = i
-                elif header == 'Tm':
-                    col_indices['team'] = i
-                elif header == 'Cmp':
-                    col_indices['pass_cmp'] = i
-                elif header == 'Att' and 'pass_att' not in col_indices:
-                    col_indices['pass_att'] = i
-                elif header == 'Yds' and 'pass_yds' not in col_indices:
-                    col_indices['pass_yds'] = i
-                elif header == 'TD' and 'pass_td' not in col_indices:
-                    col_indices['pass_td'] = i
-                elif header == 'Int':
-                    col_indices['pass_int'] = i
-            
-            # Find rushing and receiving column indices (they appear after passing)
-            passing_end = max([v for k, v in col_indices.items() if 'pass' in k], default=0)
-            
-            for i in range(passing_end + 1, len(header_text)):
-                header = header_text[i]
-                if header == 'Att' and 'rush_att' not in col_indices:
-                    col_indices['rush_att'] = i
-                elif header == 'Yds' and 'rush_yds' not in col_indices:
-                    col_indices['rush_yds'] = i
-                elif header == 'TD' and 'rush_td' not in col_indices:
-                    col_indices['rush_td'] = i
-                elif header == 'Rec':
-                    col_indices['rec_rec'] = i
-                elif header == 'Yds' and 'rec_yds' not in col_indices and 'rec_rec' in col_indices:
-                    col_indices['rec_yds'] = i
-                elif header == 'TD' and 'rec_td' not in col_indices and 'rec_rec' in col_indices:
-                    col_indices['rec_td'] = i
-                elif header == 'Tgt':
-                    col_indices['rec_tgt'] = i
+            # The player_offense layout rarely changes, so the header scan is cached
+            headers_tuple = tuple(self._text(th) for th in headers.iter('th'))
+            col_indices = self._compute_col_indices(headers_tuple)
+            
+            # Resolve the column positions once per table rather than once per row
+            min_cells = max(col_indices.values(), default=0) + 1
+            player_index = col_indices.get('player', 0)
+            team_index = col_indices.get('team', 1)
+            # Column position of each stat field in PLAYER_STATS_COLUMNS order (-1 when absent)
+            stat_indices = [col_indices.get(field, -1) for field in PLAYER_STATS_COLUMNS[3:]]
             
             # Parse player rows
-            tbody = player_table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
+            for row in _X_BODY_ROWS(player_table):
+                cells = _X_CELLS(row)
+                if len(cells) < min_cells:
+                    continue
                 
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) < max(col_indices.values(), default=0) + 1:
-                        continue
-                    
-                    # Extract player data
-                    player_name = cells[col_indices.get('player', 0)].get_text(strip=True)
-                    team = cells[col_indices.get('team', 1)].get_text(strip=True)
-                    
-                    if not player_name or not team:
-                        continue
-                    
-                    # Create player stat object
-                    player_stat = BoxscorePlayerStats(
-                        boxscore_id=boxscore_id,
-                        player_name=player_name,
-                        team=team,
-                        pass_cmp=self._safe_int(cells[col_indices.get('pass_cmp', -1)].get_text(strip=True)) if col_indices.get('pass_cmp', -1) >= 0 else None,
-                        pass_att=self._safe_int(cells[col_indices.get('pass_att', -1)].get_text(strip=True)) if col_indices.get('pass_att', -1) >= 0 else None,
-                        pass_yds=self._safe_int(cells[col_indices.get('pass_yds', -1)].get_text(strip=True)) if col_indices.get('pass_yds', -1) >= 0 else None,
-                        pass_td=self._safe_int(cells[col_indices.get('pass_td', -1)].get_text(strip=True)) if col_indices.get('pass_td', -1) >= 0 else None,
-                        pass_int=self._safe_int(cells[col_indices.get('pass_int', -1)].get_text(strip=True)) if col_indices.get('pass_int', -1) >= 0 else None,
-                        rush_att=self._safe_int(cells[col_indices.get('rush_att', -1)].get_text(strip=True)) if col_indices.get('rush_att', -1) >= 0 else None,
-                        rush_yds=self._safe_int(cells[col_indices.get('rush_yds', -1)].get_text(strip=True)) if col_indices.get('rush_yds', -1) >= 0 else None,
-                        rush_td=self._safe_int(cells[col_indices.get('rush_td', -1)].get_text(strip=True)) if col_indices.get('rush_td', -1) >= 0 else None,
-                        rec_tgt=self._safe_int(cells[col_indices.get('rec_tgt', -1)].get_text(strip=True)) if col_indices.get('rec_tgt', -1) >= 0 else None,
-                        rec_rec=self._safe_int(cells[col_indices.get('rec_rec', -1)].get_text(strip=True)) if col_indices.get('rec_rec', -1) >= 0 else None,
-                        rec_yds=self._safe_int(cells[col_indices.get('rec_yds', -1)].get_text(strip=True)) if col_indices.get('rec_yds', -1) >= 0 else None,
-                        rec_td=self._safe_int(cells[col_indices.get('rec_td', -1)].get_text(strip=True)) if col_indices.get('rec_td', -1) >= 0 else None,
-                        def_tackles=None,  # Would need defensive table
-                        def_assists=None,
-                        def_sacks=None
-                    )
-                    player_stats.append(player_stat)
-            
-            logger.info(f"👥 Extracted stats for {len(player_stats)} players")
+                # Read every cell's text once, then index by column
+                texts = [self._text(cell) for cell in cells]
+                
+                # Extract player data
+                player_name = texts[player_index]
+                team = sys.intern(texts[team_index])
+                
+                if not player_name or not team:
+                    continue
+                
+                # Build the row in PLAYER_STATS_COLUMNS order; defensive fields have no
+                # player_offense column, so they come out as None
+                player_stats.append((boxscore_id, player_name, team) + tuple(
+                    self._safe_int(texts[i]) if i >= 0 else None for i in stat_indices
+                ))
             
         except Exception as e:
             logger.error(f"❌ Error extracting player stats for {boxscore_id}: {e}")
         
         return player_stats
     
-    def extract_scoring_data(self, soup: BeautifulSoup, boxscore_id: str) -> List[BoxscoreScoring]:
+    def extract_scoring_data(self, soup, boxscore_id: str) -> List[BoxscoreScoring]:
         """Extract scoring events timeline"""
         scoring_events = []
         
         try:
+            tree = self._as_tree(soup)
+            
             # Find the scoring table
-            scoring_table = soup.find('table', {'id': 'scoring'})
-            if not scoring_table:
+            scoring_table = self._find_table(tree, 'scoring')
+            if scoring_table is None:
                 logger.warning(f"⚠️  No scoring table found for {boxscore_id}")
                 return scoring_events
             
             # Parse scoring events
-            tbody = scoring_table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
+            tbody = scoring_table.find('.//tbody')
+            if tbody is not None:
+                rows = tbody.iter('tr')
                 
                 for row in rows:
-                    cells = row.find_all(['td', 'th'])
+                    cells = _X_CELLS(row)
                     if len(cells) >= 6:
-                        quarter = cells[0].get_text(strip=True)
-                        time_remaining = cells[1].get_text(strip=True)
-                        team = cells[2].get_text(strip=True)
-                        description = cells[3].get_text(strip=True)
-                        score_home = self._safe_int(cells[4].get_text(strip=True))
-                        score_away = self._safe_int(cells[5].get_text(strip=True))
+                        quarter = self._text(cells[0])
+                        time_remaining = self._text(cells[1])
+                        team = sys.intern(self._text(cells[2]))
+                        description = self._text(cells[3])
+                        score_home = self._safe_int(self._text(cells[4]))
+                        score_away = self._safe_int(self._text(cells[5]))
                         
                         # Only add if we have a quarter (skip empty rows)
                         if quarter:
@@ -412,22 +651,25 @@ class NFLBoxscoreScraper:
         stats = []
         
         try:
-            rows = table.find('tbody').find_all('tr')
+            rows = table.find('.//tbody').iter('tr')
             current_team = None
             
             for row in rows:
                 # Check if this is a team header row
-                if 'thead' in row.get('class', []) or row.find('th'):
-                    team_header = row.find('th')
-                    if team_header and len(team_header.get_text().strip()) == 3:
-                        current_team = team_header.get_text().strip()
+                team_header = row.find('.//th')
+                if team_header is not None or 'thead' in row.get('class', '').split():
+                    if team_header is not None:
+                        header_text = team_header.text_content().strip()
+                        if len(header_text) == 3:
+                            current_team = header_text
                     continue
                 
-                cells = row.find_all('td')
+                # Read every cell's text once per row
+                cells = [td.text_content().strip() for td in row.iterfind('.//td')]
                 if len(cells) < 2 or not current_team:
                     continue
                 
-                player_name = cells[0].get_text().strip()
+                player_name = cells[0]
                 if not player_name:
                     continue
                 
@@ -441,12 +683,12 @@ class NFLBoxscoreScraper:
                 # Parse passing stats (columns vary by position)
                 if len(cells) > 4:  # Likely has passing stats
                     try:
-                        player_stat.pass_cmp = self._safe_int(cells[1].get_text())
-                        player_stat.pass_att = self._safe_int(cells[2].get_text())
-                        player_stat.pass_yds = self._safe_int(cells[3].get_text())
-                        player_stat.pass_td = self._safe_int(cells[4].get_text())
+                        player_stat.pass_cmp = self._safe_int(cells[1])
+                        player_stat.pass_att = self._safe_int(cells[2])
+                        player_stat.pass_yds = self._safe_int(cells[3])
+                        player_stat.pass_td = self._safe_int(cells[4])
                         if len(cells) > 5:
-                            player_stat.pass_int = self._safe_int(cells[5].get_text())
+                            player_stat.pass_int = self._safe_int(cells[5])
                     except:
                         pass
                 
@@ -462,22 +704,25 @@ class NFLBoxscoreScraper:
         stats = []
         
         try:
-            rows = table.find('tbody').find_all('tr')
+            rows = table.find('.//tbody').iter('tr')
             current_team = None
             
             for row in rows:
                 # Check if this is a team header row
-                if 'thead' in row.get('class', []) or row.find('th'):
-                    team_header = row.find('th')
-                    if team_header and len(team_header.get_text().strip()) == 3:
-                        current_team = team_header.get_text().strip()
+                team_header = row.find('.//th')
+                if team_header is not None or 'thead' in row.get('class', '').split():
+                    if team_header is not None:
+                        header_text = team_header.text_content().strip()
+                        if len(header_text) == 3:
+                            current_team = header_text
                     continue
                 
-                cells = row.find_all('td')
+                # Read every cell's text once per row
+                cells = [td.text_content().strip() for td in row.iterfind('.//td')]
                 if len(cells) < 2 or not current_team:
                     continue
                 
-                player_name = cells[0].get_text().strip()
+                player_name = cells[0]
                 if not player_name:
                     continue
                 
@@ -490,11 +735,11 @@ class NFLBoxscoreScraper:
                 
                 try:
                     if len(cells) > 1:
-                        player_stat.def_tackles = self._safe_int(cells[1].get_text())
+                        player_stat.def_tackles = self._safe_int(cells[1])
                     if len(cells) > 2:
-                        player_stat.def_assists = self._safe_int(cells[2].get_text())
+                        player_stat.def_assists = self._safe_int(cells[2])
                     if len(cells) > 3:
-                        player_stat.def_sacks = self._safe_float(cells[3].get_text())
+                        player_stat.def_sacks = self._safe_float(cells[3])
                 except:
                     pass
                 
@@ -505,22 +750,32 @@ class NFLBoxscoreScraper:
         
         return stats
     
-    def _safe_int(self, value: str) -> Optional[int]:
+    @staticmethod
+    def _safe_int(value: str) -> Optional[int]:
         """Safely convert string to int"""
-        if not value or value.strip() == '' or value.strip() == '--':
+        if not value:
             return None
+        value = value.strip()
+        cached = _INT_CACHE.get(value, _MISSING)
+        if cached is not _MISSING:
+            return cached
         try:
-            return int(value.strip())
-        except:
+            return int(value)
+        except ValueError:
             return None
     
-    def _safe_float(self, value: str) -> Optional[float]:
+    @staticmethod
+    def _safe_float(value: str) -> Optional[float]:
         """Safely convert string to float"""
-        if not value or value.strip() == '' or value.strip() == '--':
+        if not value:
             return None
+        value = value.strip()
+        cached = _FLOAT_CACHE.get(value, _MISSING)
+        if cached is not _MISSING:
+            return cached
         try:
-            return float(value.strip())
-        except:
+            return float(value)
+        except ValueError:
             return None
     
     def create_database_tables(self):
@@ -643,165 +898,246 @@ class NFLBoxscoreScraper:
         CREATE INDEX IF NOT EXISTS idx_scoring_team ON nfl.boxscore_scoring(team);
         """
         
+        # Lets get_available_boxscore_ids walk one season's boxscores in ID order
+        pending_sql = """
+        CREATE INDEX IF NOT EXISTS idx_game_logs_season_boxscore ON nfl.game_logs(season, boxscore_id)
+            WHERE boxscore_id IS NOT NULL AND boxscore_id <> '';
+        """
+        
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    cursor.execute(player_stats_sql)
-                    cursor.execute(team_stats_sql)
-                    cursor.execute(scoring_sql)
-                    db._connection.commit()
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                # Send all table and index definitions as one script
+                cursor.execute(player_stats_sql + team_stats_sql + scoring_sql + pending_sql)
+                connection.commit()
             
             logger.info("✅ Advanced boxscore tables created successfully!")
             
         except Exception as e:
             logger.error(f"❌ Error creating database tables: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             raise
     
     def save_boxscore_data(self, boxscore_id: str, player_stats: List[BoxscorePlayerStats], 
-                          team_stats: List[BoxscoreTeamStats], scoring_events: List[BoxscoreScoring]):
-        """Save all boxscore data to database"""
+                          team_stats: List[BoxscoreTeamStats], scoring_events: List[BoxscoreScoring],
+                          bulk_load: Optional[bool] = None, commit: bool = True):
+        """Save all boxscore data to database
+        
+        With bulk_load, rows are streamed through COPY into temporary staging
+        tables and merged with one INSERT ... SELECT per table, which is faster
+        for large backfills than multi-row INSERTs. Defaults to the scraper's
+        bulk_load setting.
+        
+        With commit=False the game is written inside a savepoint and left for the
+        caller to commit, so a batch of games can share one transaction; a failed
+        game is rolled back to its savepoint without losing the rest of the batch.
+        """
+        if bulk_load is None:
+            bulk_load = self.bulk_load
+        
+        connection = self._get_connection()
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    
-                    # Save player stats
-                    for stat in player_stats:
-                        cursor.execute("""
-                            INSERT INTO nfl.boxscore_player_stats (
-                                boxscore_id, player_name, team, pass_cmp, pass_att, pass_yds, 
-                                pass_td, pass_int, rush_att, rush_yds, rush_td, rec_tgt, 
-                                rec_rec, rec_yds, rec_td, def_tackles, def_assists, def_sacks
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (boxscore_id, player_name, team) DO UPDATE SET
-                                pass_cmp = EXCLUDED.pass_cmp,
-                                pass_att = EXCLUDED.pass_att,
-                                pass_yds = EXCLUDED.pass_yds,
-                                pass_td = EXCLUDED.pass_td,
-                                pass_int = EXCLUDED.pass_int,
-                                rush_att = EXCLUDED.rush_att,
-                                rush_yds = EXCLUDED.rush_yds,
-                                rush_td = EXCLUDED.rush_td,
-                                rec_tgt = EXCLUDED.rec_tgt,
-                                rec_rec = EXCLUDED.rec_rec,
-                                rec_yds = EXCLUDED.rec_yds,
-                                rec_td = EXCLUDED.rec_td,
-                                def_tackles = EXCLUDED.def_tackles,
-                                def_assists = EXCLUDED.def_assists,
-                                def_sacks = EXCLUDED.def_sacks
-                        """, (
-                            stat.boxscore_id, stat.player_name, stat.team, stat.pass_cmp,
-                            stat.pass_att, stat.pass_yds, stat.pass_td, stat.pass_int,
-                            stat.rush_att, stat.rush_yds, stat.rush_td, stat.rec_tgt,
-                            stat.rec_rec, stat.rec_yds, stat.rec_td, stat.def_tackles,
-                            stat.def_assists, stat.def_sacks
-                        ))
-                    
-                    # Save team stats
-                    for stat in team_stats:
-                        cursor.execute("""
-                            INSERT INTO nfl.boxscore_team_stats (
-                                boxscore_id, team, first_downs, total_yards, passing_yards,
-                                rushing_yards, turnovers, penalties, penalty_yards,
-                                time_of_possession, third_down_conversions, fourth_down_conversions
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (boxscore_id, team) DO UPDATE SET
-                                first_downs = EXCLUDED.first_downs,
-                                total_yards = EXCLUDED.total_yards,
-                                passing_yards = EXCLUDED.passing_yards,
-                                rushing_yards = EXCLUDED.rushing_yards,
-                                turnovers = EXCLUDED.turnovers,
-                                penalties = EXCLUDED.penalties,
-                                penalty_yards = EXCLUDED.penalty_yards,
-                                time_of_possession = EXCLUDED.time_of_possession,
-                                third_down_conversions = EXCLUDED.third_down_conversions,
-                                fourth_down_conversions = EXCLUDED.fourth_down_conversions
-                        """, (
-                            stat.boxscore_id, stat.team, stat.first_downs, stat.total_yards,
-                            stat.passing_yards, stat.rushing_yards, stat.turnovers,
-                            stat.penalties, stat.penalty_yards, stat.time_of_possession,
-                            stat.third_down_conversions, stat.fourth_down_conversions
-                        ))
+            with connection.cursor() as cursor:
+                # A crash can lose only the last unflushed commit, and re-scraping redoes
+                # it idempotently, so skip waiting for the WAL flush on these writes
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                if not commit:
+                    cursor.execute("SAVEPOINT save_boxscore")
                     
-                    # Save scoring events
-                    for event in scoring_events:
-                        cursor.execute("""
-                            INSERT INTO nfl.boxscore_scoring (
-                                boxscore_id, quarter, time_remaining, team, description,
-                                score_home, score_away
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        """, (
-                            event.boxscore_id, event.quarter, event.time_remaining,
-                            event.team, event.description, event.score_home, event.score_away
-                        ))
+                # Player stats are keyed on the conflict target so a batch never
+                # updates the same row twice; the last occurrence wins as before
+                player_rows = {
+                    (stat.boxscore_id, stat.player_name, stat.team): (
+                        stat.boxscore_id, stat.player_name, stat.team, stat.pass_cmp,
+                        stat.pass_att, stat.pass_yds, stat.pass_td, stat.pass_int,
+                        stat.rush_att, stat.rush_yds, stat.rush_td, stat.rec_tgt,
+                        stat.rec_rec, stat.rec_yds, stat.rec_td, stat.def_tackles,
+                        stat.def_assists, stat.def_sacks
+                    )
+                    for stat in player_stats
+                }
+                
+                team_rows = {
+                    (stat.boxscore_id, stat.team): (
+                        stat.boxscore_id, stat.team, stat.first_downs, stat.total_yards,
+                        stat.passing_yards, stat.rushing_yards, stat.turnovers,
+                        stat.penalties, stat.penalty_yards, stat.time_of_possession,
+                        stat.third_down_conversions, stat.fourth_down_conversions
+                    )
+                    for stat in team_stats
+                }
+                scoring_rows = [
+                    (
+                        event.boxscore_id, event.quarter, event.time_remaining,
+                        event.team, event.description, event.score_home, event.score_away
+                    )
+                    for event in scoring_events
+                ]
+                
+                if bulk_load:
+                    self._copy_merge(cursor, 'nfl.boxscore_player_stats', PLAYER_STATS_COLUMNS,
+                                     list(player_rows.values()), ('boxscore_id', 'player_name', 'team'))
+                    self._copy_merge(cursor, 'nfl.boxscore_team_stats', TEAM_STATS_COLUMNS,
+                                     list(team_rows.values()), ('boxscore_id', 'team'))
+                else:
+                    # Server-side prepared upserts are parsed and planned once per
+                    # connection; each table's rows go over as one array per column
+                    self._prepare_inserts(connection, cursor)
+                    for statement, rows in (('ins_boxscore_player', list(player_rows.values())),
+                                            ('ins_boxscore_team', list(team_rows.values()))):
+                        if not rows:
+                            continue
+                        array_types = PREPARED_INSERTS[statement][3]
+                        placeholders = ', '.join(f"%s::{array_type}" for array_type in array_types)
+                        cursor.execute(f"EXECUTE {statement} ({placeholders})", [list(column) for column in zip(*rows)])
+                
+                # Scoring events are append-only, so they always COPY straight into the table
+                self._copy_rows(cursor, 'nfl.boxscore_scoring', SCORING_COLUMNS, scoring_rows)
                     
-                    db._connection.commit()
+                if commit:
+                    connection.commit()
+                else:
+                    cursor.execute("RELEASE SAVEPOINT save_boxscore")
+            
+            # Saved boxscores no longer need scraping, so cached ID lists are stale
+            self._boxscore_ids_cache.clear()
             
             logger.info(f"💾 Saved boxscore data: {len(player_stats)} players, {len(team_stats)} teams, {len(scoring_events)} scores")
             
         except Exception as e:
             logger.error(f"❌ Error saving boxscore data for {boxscore_id}: {e}")
+            if commit:
+                connection.rollback()
+            else:
+                with connection.cursor() as cursor:
+                    cursor.execute("ROLLBACK TO SAVEPOINT save_boxscore")
             raise
     
+    def _prepare_inserts(self, connection, cursor):
+        """PREPARE the boxscore upserts once for each database session"""
+        if self._prepared_connection is connection:
+            return
+        for statement, (table, columns, conflict_columns, array_types) in PREPARED_INSERTS.items():
+            params = ', '.join(f"${position}" for position in range(1, len(columns) + 1))
+            cursor.execute(
+                f"PREPARE {statement} ({', '.join(array_types)}) AS "
+                f"INSERT INTO {table} ({', '.join(columns)}) SELECT * FROM unnest({params})"
+                + _on_conflict_clause(table, columns, conflict_columns)
+            )
+        self._prepared_connection = connection
+    
+    def _copy_rows(self, cursor, table: str, columns: Tuple[str, ...], rows: List[tuple]):
+        """Stream rows into `table` with COPY FROM STDIN"""
+        if not rows:
+            return
+        
+        # None is written as \N so it stays distinct from empty strings
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            tuple('\\N' if value is None else value for value in row) for row in rows
+        )
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')", buffer)
+    
+    def _copy_merge(self, cursor, table: str, columns: Tuple[str, ...], rows: List[tuple],
+                    conflict_columns: Tuple[str, ...]):
+        """COPY rows into a temporary staging table, then upsert them into `table` in one statement"""
+        if not rows:
+            return
+        
+        staging = f"tmp_{table.split('.')[-1]}"
+        column_list = ', '.join(columns)
+        cursor.execute(f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {column_list} FROM {table} WITH NO DATA")
+        self._copy_rows(cursor, staging, columns, rows)
+        
+        merge_sql = f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging}"
+        cursor.execute(merge_sql + _on_conflict_clause(table, columns, conflict_columns))
+        # Drop now rather than at commit so several games can share one transaction
+        cursor.execute(f"DROP TABLE {staging}")
+    
     def get_available_boxscore_ids(self, limit: int = 5, season: int = None) -> List[str]:
         """Get boxscore IDs from database that need detailed scraping."""
+        cache_key = (limit, season)
+        cached = self._boxscore_ids_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.BOXSCORE_IDS_TTL:
+            logger.info(f"📋 Using cached list of {len(cached[1])} boxscore IDs")
+            return list(cached[1])
+        
         try:
-            with PostgreSQLManager() as db:
-                with db._connection.cursor() as cursor:
-                    # Get existing game log entries that have boxscore_ids but no detailed stats yet
-                    season_filter = ""
-                    params = [limit]
-                    
-                    if season:
-                        season_filter = "AND gl.season = %s"
-                        params = [season, limit]
-                    
-                    query = f"""
-                        SELECT DISTINCT gl.boxscore_id 
-                        FROM nfl.game_logs gl
-                        LEFT JOIN nfl.boxscore_player_stats bps ON gl.boxscore_id = bps.boxscore_id
-                        WHERE gl.boxscore_id IS NOT NULL 
-                        AND gl.boxscore_id != ''
-                        AND bps.boxscore_id IS NULL
-                        {season_filter}
-                        ORDER BY gl.boxscore_id DESC
-                        LIMIT %s
-                    """
+            connection = self._get_connection()
+            with connection.cursor() as cursor:
+                # Get existing game log entries that have boxscore_ids but no detailed stats yet
+                if season:
+                    cursor.execute(_SQL_IDS_SEASON, (season, limit))
+                else:
+                    cursor.execute(_SQL_IDS_ALL, (limit,))
                     
-                    if season:
-                        cursor.execute(query, params)
-                    else:
-                        cursor.execute(query, (limit,))
-                    
-                    results = cursor.fetchall()
-                    boxscore_ids = [row[0] for row in results]
+                results = cursor.fetchall()
+                boxscore_ids = [row[0] for row in results]
                     
-                    if boxscore_ids:
-                        logger.info(f"📋 Found {len(boxscore_ids)} boxscore IDs needing detailed scraping")
-                        for bid in boxscore_ids:
-                            logger.info(f"   - {bid}")
-                    else:
-                        logger.info("📋 No boxscore IDs found that need detailed scraping")
+                if boxscore_ids:
+                    logger.info(f"📋 Found {len(boxscore_ids)} boxscore IDs needing detailed scraping")
+                    for bid in boxscore_ids:
+                        logger.info(f"   - {bid}")
+                else:
+                    logger.info("📋 No boxscore IDs found that need detailed scraping")
                     
-                    return boxscore_ids
+                self._boxscore_ids_cache[cache_key] = (time.monotonic(), boxscore_ids)
+                return list(boxscore_ids)
                     
         except Exception as e:
             logger.error(f"❌ Error getting boxscore IDs: {e}")
+            if self.db._connection:
+                self.db._connection.rollback()
             return []
     
-    def scrape_boxscore_details(self, boxscore_id: str) -> bool:
-        """Scrape detailed statistics for a single boxscore"""
+    def parse_boxscore(self, boxscore_id: str, html_content: str) -> Tuple[
+            List[BoxscorePlayerStats], List[BoxscoreTeamStats], List[BoxscoreScoring]]:
+        """Parse a boxscore page once with lxml and extract all data from the same tree"""
+        tree = self.parse_boxscore_tree(html_content)
+        return (
+            self.extract_player_stats(tree, boxscore_id),
+            self.extract_team_stats(tree, boxscore_id),
+            self.extract_scoring_data(tree, boxscore_id),
+        )
+    
+    def parse_boxscore_pages(self, pages: Dict[str, str], max_workers: Optional[int] = None) -> Dict[str, Tuple[
+            List[BoxscorePlayerStats], List[BoxscoreTeamStats], List[BoxscoreScoring]]]:
+        """Parse fetched boxscore pages in parallel worker processes
+        
+        Parsing is CPU-bound, so separate processes sidestep the GIL. Pages that
+        fail to parse are logged and left out of the result.
+        """
+        parsed = {}
+        workers = max_workers or os.cpu_count() or 1
+        # Hand pages over in chunks to cut down on inter-process round trips
+        chunksize = max(1, len(pages) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                 initargs=(type(self),)) as executor:
+            results = executor.map(_parse_boxscore_in_worker, pages.keys(), pages.values(),
+                                   chunksize=chunksize)
+            for boxscore_id, result, error in results:
+                if error is not None:
+                    logger.error(f"❌ Error parsing boxscore {boxscore_id}: {error}")
+                else:
+                    parsed[boxscore_id] = result
+        
+        logger.info(f"🧩 Parsed {len(parsed)}/{len(pages)} boxscores")
+        return parsed
+    
+    def scrape_boxscore_details(self, boxscore_id: str, html_content: Optional[str] = None) -> bool:
+        """Scrape detailed statistics for a single boxscore, reusing an already fetched page if given"""
         logger.info(f"🔍 Scraping boxscore details: {boxscore_id}")
         
         try:
             # Fetch the HTML
-            soup = self.fetch_boxscore_html(boxscore_id)
-            if not soup:
+            if html_content is None:
+                html_content = self.fetch_boxscore_page(boxscore_id)
+            if not html_content:
                 return False
             
-            # Extract all data
-            player_stats = self.extract_player_stats(soup, boxscore_id)
-            team_stats = self.extract_team_stats(soup, boxscore_id)
-            scoring_events = self.extract_scoring_data(soup, boxscore_id)
+            player_stats, team_stats, scoring_events = self.parse_boxscore(boxscore_id, html_content)
             
             # Save to database
             self.save_boxscore_data(boxscore_id, player_stats, team_stats, scoring_events)
@@ -813,6 +1149,25 @@ class NFLBoxscoreScraper:
             logger.error(f"❌ Error scraping boxscore {boxscore_id}: {e}")
             return False
 
+# Number of games written per transaction in main()
+SAVE_BATCH_SIZE = 50
+
+# Scraper instance reused by every parse in a worker process
+_worker_scraper = None
+
+def _init_parse_worker(scraper_cls):
+    """Build the worker process's scraper once instead of once per page"""
+    global _worker_scraper
+    _worker_scraper = scraper_cls()
+
+def _parse_boxscore_in_worker(boxscore_id: str, html_content: str):
+    """Parse one boxscore in a worker process (module-level so it can be pickled)"""
+    try:
+        return boxscore_id, _worker_scraper.parse_boxscore(boxscore_id, html_content), None
+    except Exception as e:
+        # lxml errors carry unpicklable error logs, so send back a plain message
+        return boxscore_id, None, f"{type(e).__name__}: {e}"
+
 def main():
     """Main function for testing the boxscore scraper"""
     import sys
@@ -845,126 +1200,80 @@ def main():
         
         logger.info(f"📋 Found {len(boxscore_ids)} boxscores to scrape")
         
-        # Scrape each boxscore
-        successful_scrapes = 0
+        # Fetch all pages concurrently, parse them across processes, then save each one
+        pages = scraper.fetch_boxscore_pages(boxscore_ids)
+        parsed = scraper.parse_boxscore_pages(
+            {boxscore_id: html_content for boxscore_id, html_content in pages.items() if html_content}
+        )
+        
+        # Save every game on the scraper's connection, committing once per batch
+        connection = scraper._get_connection()
+        results = []  # (boxscore_id, player rows, scoring rows) for each saved game
         for i, boxscore_id in enumerate(boxscore_ids):
             logger.info(f"🎯 Progress: {i+1}/{len(boxscore_ids)}")
-            if scraper.scrape_boxscore_details(boxscore_id):
-                successful_scrapes += 1
-            
-            # Be respectful with delays between requests
-            if i < len(boxscore_ids) - 1:  # Don't delay after the last request
-                time.sleep(random.uniform(2, 4))
+            if boxscore_id in parsed:
+                try:
+                    player_stats, team_stats, scoring_events = parsed[boxscore_id]
+                    scraper.save_boxscore_data(boxscore_id, player_stats, team_stats, scoring_events, commit=False)
+                    logger.info(f"✅ Successfully scraped boxscore: {boxscore_id}")
+                    results.append((boxscore_id, len(player_stats), len(scoring_events)))
+                except Exception as e:
+                    logger.error(f"❌ Error scraping boxscore {boxscore_id}: {e}")
+            if (i + 1) % SAVE_BATCH_SIZE == 0:
+                connection.commit()
+        connection.commit()
         
-        logger.info(f"🎯 Scraping completed: {successful_scrapes}/{len(boxscore_ids)} successful")
+        logger.info(f"🎯 Scraping completed: {len(results)}/{len(boxscore_ids)} successful")
         
         # Export to CSV files
         logger.info("\n📤 Exporting data to CSV files...")
-        export_csv_data()
+        export_csv_data(connection)
         
-        # Show some sample results
+        # Show some sample results from the counts gathered while saving
         logger.info("\n📊 Sample advanced data:")
-        with PostgreSQLManager() as db:
-            with db._connection.cursor() as cursor:
-                cursor.execute("""
-                    SELECT boxscore_id, COUNT(*) as player_count
-                    FROM nfl.boxscore_player_stats 
-                    GROUP BY boxscore_id 
-                    ORDER BY boxscore_id 
-                    LIMIT 5
-                """)
-                results = cursor.fetchall()
-                for boxscore_id, count in results:
-                    logger.info(f"   📋 {boxscore_id}: {count} player records")
-                    
-                # Show some scoring data
-                cursor.execute("""
-                    SELECT COUNT(*) as total_scoring_events,
-                           COUNT(DISTINCT boxscore_id) as games_with_scoring
-                    FROM nfl.boxscore_scoring
-                """)
-                scoring_result = cursor.fetchone()
-                logger.info(f"   🏆 Total scoring events: {scoring_result[0]} across {scoring_result[1]} games")
+        for boxscore_id, player_count, _ in sorted(results)[:5]:
+            logger.info(f"   📋 {boxscore_id}: {player_count} player records")
+        total_scoring_events = sum(scoring_count for _, _, scoring_count in results)
+        games_with_scoring = sum(1 for _, _, scoring_count in results if scoring_count)
+        logger.info(f"   🏆 Total scoring events: {total_scoring_events} across {games_with_scoring} games")
         
     except Exception as e:
         logger.error(f"❌ Scraping failed: {e}")
         raise
+    finally:
+        scraper.close()
 
-def export_csv_data():
-    """Export all advanced boxscore data to CSV files"""
-    import pandas as pd
-    from datetime import datetime
-    
+# Read/write block size for the COPY TO STDOUT exports
+CSV_EXPORT_BUFFER_SIZE = 64 * 1024
+
+# Export name and ordered query for each table written by export_csv_data
+CSV_EXPORTS = (
+    ('boxscore_team_stats', "SELECT * FROM nfl.boxscore_team_stats ORDER BY boxscore_id, team", 'team stat'),
+    ('boxscore_player_stats', "SELECT * FROM nfl.boxscore_player_stats ORDER BY boxscore_id, team, player_name", 'player stat'),
+    ('boxscore_scoring', "SELECT * FROM nfl.boxscore_scoring ORDER BY boxscore_id, quarter, time_remaining", 'scoring event'),
+)
+
+def export_csv_data(connection=None):
+    """Export all advanced boxscore data to CSV files, on the given connection or a new one"""
     try:
-        with PostgreSQLManager() as db:
-            with db._connection.cursor() as cursor:
-                
-                # Export team stats
-                cursor.execute("SELECT * FROM nfl.boxscore_team_stats ORDER BY boxscore_id, team")
-                team_data = cursor.fetchall()
-                
-                if team_data:
-                    # Get column names
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'nfl' AND table_name = 'boxscore_team_stats'
-                        ORDER BY ordinal_position
-                    """)
-                    team_columns = [row[0] for row in cursor.fetchall()]
+        with contextlib.ExitStack() as stack:
+            if connection is None:
+                connection = stack.enter_context(PostgreSQLManager())._connection
+            with connection.cursor() as cursor:
+                for data_type, query, label in CSV_EXPORTS:
+                    filename = generate_export_filename("NFL", data_type, season=datetime.now().year)
+                    os.makedirs(os.path.dirname(filename), exist_ok=True)
                     
-                    team_df = pd.DataFrame(team_data, columns=team_columns)
-                    export_dataframe_to_csv(
-                        team_df, 
-                        sport="NFL",
-                        data_type="boxscore_team_stats",
-                        season=datetime.now().year
-                    )
-                    logger.info(f"✅ Exported {len(team_df)} team stat records to CSV")
-                
-                # Export player stats  
-                cursor.execute("SELECT * FROM nfl.boxscore_player_stats ORDER BY boxscore_id, team, player_name")
-                player_data = cursor.fetchall()
-                
-                if player_data:
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'nfl' AND table_name = 'boxscore_player_stats'
-                        ORDER BY ordinal_position
-                    """)
-                    player_columns = [row[0] for row in cursor.fetchall()]
+                    # COPY streams the CSV straight to disk without building rows in Python,
+                    # in 64 KiB blocks rather than the 8 KiB default
+                    with open(filename, 'w', newline='') as csv_file:
+                        cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT CSV, HEADER)",
+                                           csv_file, size=CSV_EXPORT_BUFFER_SIZE)
                     
-                    player_df = pd.DataFrame(player_data, columns=player_columns)
-                    export_dataframe_to_csv(
-                        player_df,
-                        sport="NFL", 
-                        data_type="boxscore_player_stats",
-                        season=datetime.now().year
-                    )
-                    logger.info(f"✅ Exported {len(player_df)} player stat records to CSV")
-                
-                # Export scoring events
-                cursor.execute("SELECT * FROM nfl.boxscore_scoring ORDER BY boxscore_id, quarter, time_remaining")
-                scoring_data = cursor.fetchall()
-                
-                if scoring_data:
-                    cursor.execute("""
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'nfl' AND table_name = 'boxscore_scoring'
-                        ORDER BY ordinal_position
-                    """)
-                    scoring_columns = [row[0] for row in cursor.fetchall()]
-                    
-                    scoring_df = pd.DataFrame(scoring_data, columns=scoring_columns)
-                    export_dataframe_to_csv(
-                        scoring_df,
-                        sport="NFL",
-                        data_type="boxscore_scoring", 
-                        season=datetime.now().year
-                    )
-                    logger.info(f"✅ Exported {len(scoring_df)} scoring event records to CSV")
+                    if cursor.rowcount == 0:
+                        os.remove(filename)
+                        continue
+                    logger.info(f"✅ Exported {cursor.rowcount} {label} records to {filename}")
                     
     except Exception as e:
         logger.error(f"❌ Error exporting CSV data: {e}")
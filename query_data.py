@@ -35,15 +35,16 @@ def run_query(query, description="Custom Query"):
                     # Get column names
                     columns = [desc[0] for desc in cursor.description]
                     
+                    # One format string for every line instead of an f-string per cell
+                    line_format = " | ".join(["{:15}"] * len(columns))
+                    
                     # Print header
-                    header = " | ".join(f"{col:15}" for col in columns)
+                    header = line_format.format(*columns)
                     print(header)
                     print("-" * len(header))
                     
-                    # Print data
-                    for row in results:
-                        row_str = " | ".join(f"{str(val):15}" for val in row)
-                        print(row_str)
+                    # Print data in a single write
+                    sys.stdout.write("".join(line_format.format(*map(str, row)) + "\n" for row in results))
                     
                     print(f"\n📊 Total records: {len(results)}")
                 else:
@@ -28,38 +28,67 @@ def show_query_examples():
     with PostgreSQLManager() as db:
         with db._connection.cursor() as cursor:
             
-            # Example 1: Top defensive players by tackles
-            print('🛡️ TOP DEFENSIVE PLAYERS BY TACKLES:')
+            # All four examples come back in one round trip, each as a JSON array of rows
             cursor.execute('''
-                SELECT player_name, team, def_tackles, def_sacks, def_int
-                FROM nfl.boxscore_player_stats 
-                WHERE player_role = 'defense' AND def_tackles > 0
-                ORDER BY def_tackles DESC, def_sacks DESC
-                LIMIT 8
+                SELECT
+                    (SELECT COALESCE(json_agg(t), '[]') FROM (
+                        SELECT player_name, team, def_tackles, def_sacks, def_int
+                        FROM nfl.boxscore_player_stats 
+                        WHERE player_role = 'defense' AND def_tackles > 0
+                        ORDER BY def_tackles DESC, def_sacks DESC
+                        LIMIT 8
+                    ) t),
+                    (SELECT COALESCE(json_agg(t), '[]') FROM (
+                        SELECT player_name, team, 
+                               COALESCE(pass_yds, 0) + COALESCE(rush_yds, 0) + COALESCE(rec_yds, 0) as total_yards,
+                               COALESCE(pass_yds, 0) as pass_yds,
+                               COALESCE(rush_yds, 0) as rush_yds, 
+                               COALESCE(rec_yds, 0) as rec_yds
+                        FROM nfl.boxscore_player_stats 
+                        WHERE player_role = 'offense'
+                        ORDER BY total_yards DESC
+                        LIMIT 8
+                    ) t),
+                    (SELECT COALESCE(json_agg(t), '[]') FROM (
+                        SELECT player_name, team,
+                               COALESCE(kick_returns, 0) as kick_ret,
+                               COALESCE(kick_return_yards, 0) as kick_yds,
+                               COALESCE(punt_returns, 0) as punt_ret,
+                               COALESCE(punt_return_yards, 0) as punt_yds,
+                               COALESCE(kick_return_td, 0) + COALESCE(punt_return_td, 0) as return_tds
+                        FROM nfl.boxscore_player_stats 
+                        WHERE player_role IN ('special_teams', 'mixed') 
+                          AND (kick_returns > 0 OR punt_returns > 0)
+                        ORDER BY (kick_return_yards + punt_return_yards) DESC
+                    ) t),
+                    (SELECT COALESCE(json_agg(t), '[]') FROM (
+                        SELECT team, player_role, COUNT(*) as count
+                        FROM nfl.boxscore_player_stats 
+                        WHERE player_role != 'unknown'
+                        GROUP BY team, player_role
+                        ORDER BY team, 
+                                 CASE player_role 
+                                   WHEN 'offense' THEN 1
+                                   WHEN 'defense' THEN 2  
+                                   WHEN 'special_teams' THEN 3
+                                   WHEN 'mixed' THEN 4
+                                 END
+                    ) t)
             ''')
+            defenders, offense, returns, team_breakdown = cursor.fetchone()
             
-            defenders = cursor.fetchall()
-            for name, team, tackles, sacks, ints in defenders:
-                print(f'  • {name} ({team}): {tackles} tackles, {sacks} sacks, {ints} INTs')
+            # Example 1: Top defensive players by tackles
+            print('🛡️ TOP DEFENSIVE PLAYERS BY TACKLES:')
+            for row in defenders:
+                print(f"  • {row['player_name']} ({row['team']}): {row['def_tackles']} tackles, {row['def_sacks']} sacks, {row['def_int']} INTs")
             
             print()
             
             # Example 2: Top offensive players by yards
             print('🏈 TOP OFFENSIVE PLAYERS BY TOTAL YARDS:')
-            cursor.execute('''
-                SELECT player_name, team, 
-                       COALESCE(pass_yds, 0) + COALESCE(rush_yds, 0) + COALESCE(rec_yds, 0) as total_yards,
-                       COALESCE(pass_yds, 0) as pass_yds,
-                       COALESCE(rush_yds, 0) as rush_yds, 
-                       COALESCE(rec_yds, 0) as rec_yds
-                FROM nfl.boxscore_player_stats 
-                WHERE player_role = 'offense'
-                ORDER BY total_yards DESC
-                LIMIT 8
-            ''')
-            
-            offense = cursor.fetchall()
-            for name, team, total, passing, rushing, receiving in offense:
+            for row in offense:
+                name, team, total = row['player_name'], row['team'], row['total_yards']
+                passing, rushing, receiving = row['pass_yds'], row['rush_yds'], row['rec_yds']
                 if total > 0:
                     stats = []
                     if passing > 0: stats.append(f'{passing} pass')
@@ -71,21 +100,10 @@ def show_query_examples():
             
             # Example 3: Special teams impact
             print('🎯 SPECIAL TEAMS IMPACT PLAYERS:')
-            cursor.execute('''
-                SELECT player_name, team,
-                       COALESCE(kick_returns, 0) as kick_ret,
-                       COALESCE(kick_return_yards, 0) as kick_yds,
-                       COALESCE(punt_returns, 0) as punt_ret,
-                       COALESCE(punt_return_yards, 0) as punt_yds,
-                       COALESCE(kick_return_td, 0) + COALESCE(punt_return_td, 0) as return_tds
-                FROM nfl.boxscore_player_stats 
-                WHERE player_role IN ('special_teams', 'mixed') 
-                  AND (kick_returns > 0 OR punt_returns > 0)
-                ORDER BY (kick_return_yards + punt_return_yards) DESC
-            ''')
-            
-            returns = cursor.fetchall()
-            for name, team, kick_ret, kick_yds, punt_ret, punt_yds, tds in returns:
+            for row in returns:
+                name, team = row['player_name'], row['team']
+                kick_ret, kick_yds = row['kick_ret'], row['kick_yds']
+                punt_ret, punt_yds, tds = row['punt_ret'], row['punt_yds'], row['return_tds']
                 total_yds = kick_yds + punt_yds
                 stats = []
                 if kick_ret > 0: stats.append(f'{kick_ret} kick ret ({kick_yds} yds)')
@@ -97,23 +115,9 @@ def show_query_examples():
             
             # Example 4: Team breakdown by position groups
             print('📊 PLAYER DISTRIBUTION BY TEAM AND ROLE:')
-            cursor.execute('''
-                SELECT team, player_role, COUNT(*) as count
-                FROM nfl.boxscore_player_stats 
-                WHERE player_role != 'unknown'
-                GROUP BY team, player_role
-                ORDER BY team, 
-                         CASE player_role 
-                           WHEN 'offense' THEN 1
-                           WHEN 'defense' THEN 2  
-                           WHEN 'special_teams' THEN 3
-                           WHEN 'mixed' THEN 4
-                         END
-            ''')
-            
-            team_breakdown = cursor.fetchall()
             current_team = None
-            for team, role, count in team_breakdown:
+            for row in team_breakdown:
+                team, role, count = row['team'], row['player_role'], row['count']
                 if team != current_team:
                     if current_team is not None:
                         print()
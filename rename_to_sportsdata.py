@@ -4,9 +4,12 @@ Simple Database Rename Script
 Renames 'nfl' database to 'sportsdata' and updates configuration
 """
 
-import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
+import atexit
 import logging
+import re
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import sys
 
@@ -26,55 +29,75 @@ DB_CONFIG = {
     'port': 5432
 }
 
+# One small pool per database, opened on first use so the helpers share connections
+_pools = {}
+
+def _get_pool(database):
+    """Get the connection pool for a database, creating it on first use"""
+    pool = _pools.get(database)
+    if pool is None:
+        pool = ThreadedConnectionPool(1, 4, **{**DB_CONFIG, 'database': database})
+        _pools[database] = pool
+    return pool
+
+@atexit.register
+def _close_pools():
+    """Close every pooled connection on exit"""
+    for pool in _pools.values():
+        pool.closeall()
+    _pools.clear()
+
 @contextmanager
-def get_postgres_connection():
-    """Get connection to postgres database for admin operations"""
-    admin_config = {**DB_CONFIG, 'database': 'postgres'}
-    conn = None
+def get_postgres_connection(database='postgres'):
+    """Get a pooled autocommit connection, to the postgres database for admin operations by default"""
+    pool = _get_pool(database)
+    conn = pool.getconn()
     try:
-        conn = psycopg2.connect(**admin_config)
         conn.autocommit = True
         yield conn
     finally:
-        if conn:
-            conn.close()
+        pool.putconn(conn)
 
-def check_database_exists(db_name):
-    """Check if a database exists"""
+def get_existing_databases(db_names):
+    """Get the subset of the given database names that exist, in one query"""
     with get_postgres_connection() as conn:
         with conn.cursor() as cursor:
             cursor.execute("""
-                SELECT 1 FROM pg_database WHERE datname = %s
-            """, (db_name,))
-            return cursor.fetchone() is not None
+                SELECT datname FROM pg_database WHERE datname = ANY(%s)
+            """, (list(db_names),))
+            return {row[0] for row in cursor.fetchall()}
 
 def rename_database():
     """Rename 'nfl' database to 'sportsdata'"""
     logger.info("🔄 Renaming database from 'nfl' to 'sportsdata'...")
     
-    if check_database_exists('sportsdata'):
+    existing_databases = get_existing_databases(('sportsdata', 'nfl'))
+    
+    if 'sportsdata' in existing_databases:
         logger.warning("⚠️  Database 'sportsdata' already exists")
         return True
     
-    if not check_database_exists('nfl'):
+    if 'nfl' not in existing_databases:
         logger.error("❌ Source database 'nfl' does not exist")
         return False
     
     try:
         with get_postgres_connection() as conn:
             with conn.cursor() as cursor:
-                # Terminate any active connections to the database
-                logger.info("🔌 Terminating active connections to 'nfl' database...")
+                # Terminate any active connections to the database and rename it in one
+                # round trip, leaving clients no time to reconnect in between
+                logger.info("🔌 Terminating active connections to 'nfl' database and renaming it...")
                 cursor.execute("""
-                    SELECT pg_terminate_backend(pid)
-                    FROM pg_stat_activity
-                    WHERE datname = 'nfl' AND pid <> pg_backend_pid()
+                    DO $$
+                    BEGIN
+                        PERFORM pg_terminate_backend(pid)
+                        FROM pg_stat_activity
+                        WHERE datname = 'nfl' AND pid <> pg_backend_pid();
+                    END
+                    $$;
+                    ALTER DATABASE nfl RENAME TO sportsdata;
                 """)
                 
-                # Rename the database
-                logger.info("📝 Renaming database...")
-                cursor.execute('ALTER DATABASE nfl RENAME TO sportsdata')
-                
         logger.info("✅ Database renamed successfully")
         return True
         
@@ -88,18 +111,20 @@ def verify_rename():
     
     try:
         # Check new database exists and has our data
-        config = {**DB_CONFIG, 'database': 'sportsdata'}
-        conn = psycopg2.connect(**config)
-        
-        with conn.cursor() as cursor:
-            # Check schemas
+        with get_postgres_connection('sportsdata') as conn, conn.cursor() as cursor:
+            # Sport schemas and whether the old database remains, in one query
+            # (pg_database is a shared catalog, so it is visible from here)
             cursor.execute("""
-                SELECT schema_name 
-                FROM information_schema.schemata 
-                WHERE schema_name IN ('nfl', 'nba', 'nhl', 'ncaaf', 'ncaab')
-                ORDER BY schema_name
+                SELECT
+                    ARRAY(
+                        SELECT schema_name::text
+                        FROM information_schema.schemata 
+                        WHERE schema_name IN ('nfl', 'nba', 'nhl', 'ncaaf', 'ncaab')
+                        ORDER BY schema_name
+                    ),
+                    EXISTS (SELECT 1 FROM pg_database WHERE datname = 'nfl')
             """)
-            schemas = [row[0] for row in cursor.fetchall()]
+            schemas, old_database_exists = cursor.fetchone()
             logger.info(f"✅ Found {len(schemas)} sport schemas: {schemas}")
             
             # Check NFL data
@@ -108,10 +133,8 @@ def verify_rename():
                 count = cursor.fetchone()[0]
                 logger.info(f"✅ NFL game_logs: {count} records")
         
-        conn.close()
-        
         # Verify old database no longer exists
-        if not check_database_exists('nfl'):
+        if not old_database_exists:
             logger.info("✅ Old 'nfl' database no longer exists")
         else:
             logger.warning("⚠️  Old 'nfl' database still exists")
@@ -130,14 +153,19 @@ def update_env_file():
     env_file = "/allsportsreference/.env"
     
     try:
-        with open(env_file, 'r') as f:
+        # Read and rewrite through one handle, leaving the file untouched if already updated
+        with open(env_file, 'r+') as f:
             content = f.read()
-        
-        # Update database name (keep user as 'nfl' for now)
-        content = content.replace('DB_NAME=nfl', 'DB_NAME=sportsdata')
-        
-        with open(env_file, 'w') as f:
+            if 'DB_NAME=nfl' not in content:
+                logger.info("⏭️  .env file already up to date")
+                return True
+            
+            # Update database name (keep user as 'nfl' for now)
+            content = content.replace('DB_NAME=nfl', 'DB_NAME=sportsdata')
+            
+            f.seek(0)
             f.write(content)
+            f.truncate()
         
         logger.info("✅ .env file updated")
         return True
@@ -146,6 +174,35 @@ def update_env_file():
         logger.error(f"❌ Failed to update .env file: {e}")
         return False
 
+# 'database': 'nfl' in either quote style, as written in the scripts' config dictionaries
+_DATABASE_NAME_RE = re.compile(r"""(['"])database\1(\s*:\s*)\1nfl\1""")
+
+def _rewrite_script(file_path):
+    """Point one script's database configuration at 'sportsdata'"""
+    try:
+        # Read and rewrite through one handle; the file is only truncated once the new content is ready
+        with open(file_path, 'r+') as f:
+            content = f.read()
+            
+            # Update database name in configuration dictionaries
+            content, replacements = _DATABASE_NAME_RE.subn(r"\1database\1\2\1sportsdata\1", content)
+            if not replacements:
+                logger.info(f"⏭️  No database settings to change in {file_path}")
+                return False
+            
+            f.seek(0)
+            f.write(content)
+            f.truncate()
+        
+        logger.info(f"✅ Updated {file_path}")
+        return True
+        
+    except FileNotFoundError:
+        logger.warning(f"⚠️  File not found: {file_path}")
+    except Exception as e:
+        logger.error(f"❌ Failed to update {file_path}: {e}")
+    return False
+
 def update_scripts():
     """Update database configuration in our scripts"""
     logger.info("🔧 Updating script configurations...")
@@ -157,24 +214,10 @@ def update_scripts():
         "/allsportsreference/example_data_collection.py"
     ]
     
-    for file_path in files_to_update:
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-            
-            # Update database name in configuration dictionaries
-            content = content.replace("'database': 'nfl'", "'database': 'sportsdata'")
-            content = content.replace('"database": "nfl"', '"database": "sportsdata"')
-            
-            with open(file_path, 'w') as f:
-                f.write(content)
-            
-            logger.info(f"✅ Updated {file_path}")
-            
-        except FileNotFoundError:
-            logger.warning(f"⚠️  File not found: {file_path}")
-        except Exception as e:
-            logger.error(f"❌ Failed to update {file_path}: {e}")
+    # The files are independent, so rewrite them concurrently
+    with ThreadPoolExecutor(max_workers=len(files_to_update)) as executor:
+        updated = sum(executor.map(_rewrite_script, files_to_update))
+    logger.info(f"📄 Updated {updated}/{len(files_to_update)} scripts")
     
     return True
 
@@ -20,7 +20,7 @@ import argparse
 from pathlib import Path
 from loguru import logger
 from dotenv import load_dotenv
-from typing import List
+from typing import Dict, List
 
 # Load environment variables
 env_path = Path(__file__).parent / '.env'
@@ -46,14 +46,12 @@ def test_database_connection() -> bool:
     """Test if we can connect to the database."""
     try:
         with PostgreSQLManager() as db:
-            result = db.fetch_one("SELECT version();")
-            if result:
-                logger.info(f"✅ Database connection successful!")
-                logger.info(f"PostgreSQL version: {result[0]}")
-                return True
-            else:
-                logger.error("❌ Database connection failed - no version info")
-                return False
+            # The server reports its version during the handshake, so no query is needed
+            server_version = db._connection.server_version
+            major, minor = divmod(server_version, 10000)
+            logger.info(f"✅ Database connection successful!")
+            logger.info(f"PostgreSQL version: {major}.{minor}")
+            return True
     except Exception as e:
         logger.error(f"❌ Database connection failed: {e}")
         return False
@@ -66,13 +64,16 @@ def get_existing_schemas() -> List[str]:
     
     try:
         with PostgreSQLManager() as db:
-            for schema in sport_schemas:
-                result = db.fetch_one(
-                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                    (schema,)
-                )
-                if result:
-                    existing_schemas.append(schema)
+            # One query for all schemas, kept in sport_schemas order
+            rows = db.fetch_all(
+                """
+                SELECT schema_name FROM information_schema.schemata
+                WHERE schema_name = ANY(%s)
+                ORDER BY array_position(%s, schema_name::text)
+                """,
+                (sport_schemas, sport_schemas)
+            )
+            existing_schemas = [row[0] for row in rows]
                     
     except Exception as e:
         logger.error(f"Failed to check existing schemas: {e}")
@@ -80,61 +81,36 @@ def get_existing_schemas() -> List[str]:
     return existing_schemas
 
 
-def get_schema_stats(schema: str) -> dict:
-    """Get statistics for a schema."""
-    stats = {
-        'tables': 0,
-        'indexes': 0,
-        'views': 0,
-        'records': 0
+def get_all_schema_stats(db: PostgreSQLManager, schemas: List[str]) -> Dict[str, dict]:
+    """Get existence flags and statistics for several schemas in one query.
+
+    Each schema maps to `schema_exists` and `table_exists` (for game_logs) flags
+    plus table, index and view counts and the estimated game_logs record count,
+    taken from pg_class.reltuples rather than a COUNT(*) scan.
+    """
+    rows = db.fetch_all(
+        """
+        SELECT s.name,
+               EXISTS (SELECT 1 FROM information_schema.schemata WHERE schema_name = s.name),
+               EXISTS (SELECT 1 FROM information_schema.tables
+                       WHERE table_schema = s.name AND table_name = 'game_logs'),
+               (SELECT COUNT(*) FROM information_schema.tables
+                WHERE table_schema = s.name AND table_type = 'BASE TABLE'),
+               (SELECT COUNT(*) FROM information_schema.views WHERE table_schema = s.name),
+               (SELECT COUNT(*) FROM pg_indexes WHERE schemaname = s.name),
+               COALESCE((SELECT GREATEST(c.reltuples, 0)::bigint FROM pg_class c
+                         WHERE c.oid = to_regclass(quote_ident(s.name) || '.game_logs')), 0)
+        FROM unnest(%s::text[]) AS s(name)
+        """,
+        (schemas,)
+    )
+    return {
+        name: {
+            'schema_exists': schema_exists, 'table_exists': table_exists,
+            'tables': tables, 'indexes': indexes, 'views': views, 'records': records,
+        }
+        for name, schema_exists, table_exists, tables, views, indexes, records in rows
     }
-    
-    try:
-        with PostgreSQLManager() as db:
-            # Count tables
-            tables_result = db.fetch_all(
-                """
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = %s AND table_type = 'BASE TABLE'
-                """,
-                (schema,)
-            )
-            stats['tables'] = len(tables_result) if tables_result else 0
-            
-            # Count views
-            views_result = db.fetch_all(
-                """
-                SELECT table_name 
-                FROM information_schema.views 
-                WHERE table_schema = %s
-                """,
-                (schema,)
-            )
-            stats['views'] = len(views_result) if views_result else 0
-            
-            # Count indexes
-            indexes_result = db.fetch_all(
-                """
-                SELECT indexname 
-                FROM pg_indexes 
-                WHERE schemaname = %s
-                """,
-                (schema,)
-            )
-            stats['indexes'] = len(indexes_result) if indexes_result else 0
-            
-            # Count records in game_logs table if it exists
-            try:
-                records_result = db.fetch_one(f"SELECT COUNT(*) FROM {schema}.game_logs")
-                stats['records'] = records_result[0] if records_result else 0
-            except:
-                stats['records'] = 0
-                
-    except Exception as e:
-        logger.warning(f"Failed to get stats for schema {schema}: {e}")
-        
-    return stats
 
 
 def drop_all_sport_schemas() -> bool:
@@ -150,15 +126,21 @@ def drop_all_sport_schemas() -> bool:
     
     try:
         with PostgreSQLManager() as db:
+            # Get stats for every schema up front, before dropping any
+            all_stats = get_all_schema_stats(db, existing_schemas)
             for schema in existing_schemas:
-                # Get stats before dropping
-                stats = get_schema_stats(schema)
-                logger.info(f"   📊 {schema.upper()}: {stats['tables']} tables, {stats['indexes']} indexes, {stats['records']} records")
-                
-                # Drop the schema
-                logger.info(f"   🗑️  Dropping schema: {schema}")
-                db.execute_sql(f"DROP SCHEMA IF EXISTS {schema} CASCADE;")
-                logger.info(f"   ✅ Schema {schema} dropped successfully")
+                stats = all_stats[schema]
+                logger.info(f"   📊 {schema.upper()}: {stats['tables']} tables, {stats['indexes']} indexes, ~{stats['records']} records")
+            
+            # Names are interpolated into the DROP, so only ever drop known sport schemas
+            unknown_schemas = set(existing_schemas) - set(sport_schemas)
+            if unknown_schemas:
+                raise ValueError(f"Refusing to drop non-sport schemas: {sorted(unknown_schemas)}")
+            
+            # Drop every schema in one statement
+            logger.info(f"   🗑️  Dropping schemas: {', '.join(existing_schemas)}")
+            db.execute_sql(f"DROP SCHEMA IF EXISTS {', '.join(existing_schemas)} CASCADE;")
+            logger.info(f"   ✅ Schemas dropped successfully")
         
         logger.info(f"🎯 All {len(existing_schemas)} sport schemas dropped successfully!")
         return True
@@ -202,27 +184,13 @@ def verify_rebuild() -> bool:
     
     try:
         with PostgreSQLManager() as db:
+            # Existence checks and stats for every sport come back from one query
+            all_stats = get_all_schema_stats(db, sport_schemas)
             for schema in sport_schemas:
-                # Check if schema exists
-                schema_result = db.fetch_one(
-                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                    (schema,)
-                )
+                stats = all_stats[schema]
                 
-                if schema_result:
-                    # Check if game_logs table exists
-                    table_result = db.fetch_one(
-                        """
-                        SELECT table_name 
-                        FROM information_schema.tables 
-                        WHERE table_schema = %s AND table_name = 'game_logs'
-                        """,
-                        (schema,)
-                    )
-                    
-                    if table_result:
-                        # Get table stats
-                        stats = get_schema_stats(schema)
+                if stats['schema_exists']:
+                    if stats['table_exists']:
                         logger.info(f"   ✅ {schema.upper()}: Schema ✓, Table ✓, {stats['indexes']} indexes, {stats['views']} views")
                         success_count += 1
                     else:
@@ -256,30 +224,11 @@ def show_final_status():
     
     try:
         with PostgreSQLManager() as db:
+            all_stats = get_all_schema_stats(db, list(sport_configs))
             for schema, display_name in sport_configs.items():
-                # Check schema
-                schema_exists = db.fetch_one(
-                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                    (schema,)
-                ) is not None
-                
-                # Check table
-                table_exists = False
-                record_count = 0
-                
-                if schema_exists:
-                    table_exists = db.fetch_one(
-                        """
-                        SELECT table_name 
-                        FROM information_schema.tables 
-                        WHERE table_schema = %s AND table_name = 'game_logs'
-                        """,
-                        (schema,)
-                    ) is not None
-                    
-                    if table_exists:
-                        count_result = db.fetch_one(f"SELECT COUNT(*) FROM {schema}.game_logs")
-                        record_count = count_result[0] if count_result else 0
+                # Schema, table and estimated record count from the one stats query
+                stats = all_stats[schema]
+                schema_exists, table_exists, record_count = stats['schema_exists'], stats['table_exists'], stats['records']
                 
                 schema_status = "✅" if schema_exists else "❌"
                 table_status = "✅" if table_exists else "❌"
@@ -287,7 +236,7 @@ def show_final_status():
                 logger.info(f"   {display_name}:")
                 logger.info(f"      Schema: {schema_status} ({schema})")
                 logger.info(f"      Table:  {table_status} (game_logs)")
-                logger.info(f"      Records: {record_count}")
+                logger.info(f"      Records: ~{record_count}")
                 
     except Exception as e:
         logger.error(f"Failed to show final status: {e}")
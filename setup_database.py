@@ -10,6 +10,7 @@ Usage:
     python setup_database.py --schema=nfl   # Setup with custom schema
     python setup_database.py --reset        # Drop and recreate tables
     python setup_database.py --test         # Test database connection
+    python setup_database.py --configure-io # Enable io_uring I/O (PostgreSQL 18+)
 """
 
 import sys
@@ -48,14 +49,22 @@ def test_database_connection():
     """Test if we can connect to the database."""
     try:
         with PostgreSQLManager() as db:
-            result = db.fetch_all("SELECT version();")
-            if result:
-                logger.info(f"✅ Database connection successful!")
-                logger.info(f"PostgreSQL version: {result[0][0]}")
-                return True
-            else:
-                logger.error("❌ Database connection failed - no version info")
-                return False
+            result = db.fetch_all("SELECT version(), pg_backend_pid();")
+        if not result:
+            logger.error("❌ Database connection failed - no version info")
+            return False
+        
+        logger.info(f"✅ Database connection successful!")
+        logger.info(f"PostgreSQL version: {result[0][0]}")
+        
+        # A second manager should be handed the same pooled backend rather than reconnecting
+        with PostgreSQLManager() as db:
+            backend_pid = db.fetch_one("SELECT pg_backend_pid();")[0]
+        if backend_pid == result[0][1]:
+            logger.info(f"🔁 Pooled connection reused (backend pid {backend_pid})")
+        else:
+            logger.warning(f"⚠️ Pooled connection not reused (backend pid {result[0][1]} -> {backend_pid})")
+        return True
     except Exception as e:
         logger.error(f"❌ Database connection failed: {e}")
         return False
@@ -84,16 +93,17 @@ def check_tables_exist(schema_name: str = "nfl") -> dict:
     
     try:
         with PostgreSQLManager() as db:
-            for table_name in tables.keys():
-                result = db.fetch_all(
-                    """
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = %s AND table_name = %s
-                    """,
-                    (schema_name, table_name)
-                )
-                tables[table_name] = len(result) > 0
+            # Probe every table in one query
+            result = db.fetch_all(
+                """
+                SELECT table_name 
+                FROM information_schema.tables 
+                WHERE table_schema = %s AND table_name = ANY(%s)
+                """,
+                (schema_name, list(tables))
+            )
+            for (table_name,) in result:
+                tables[table_name] = True
                 
     except Exception as e:
         logger.error(f"Failed to check table existence: {e}")
@@ -136,12 +146,15 @@ def setup_database_schema(schema_name: str = "nfl", reset: bool = False):
         # Get all setup statements
         setup_statements = setup_nfl_database_schema(schema_name)
         
-        # Execute each statement
+        # Send every statement in one batch so the whole setup costs a single round trip
+        setup_script = "\n".join(
+            statement if statement.rstrip().endswith(';') else statement.rstrip() + ';'
+            for statement in setup_statements
+        )
         with PostgreSQLManager() as db:
-            for i, sql_statement in enumerate(setup_statements, 1):
-                logger.info(f"📝 Executing statement {i}/{len(setup_statements)}...")
-                db.execute_sql(sql_statement)
-                logger.info(f"✅ Statement {i} executed successfully")
+            logger.info(f"📝 Executing {len(setup_statements)} setup statements...")
+            db.execute_sql(setup_script)
+            logger.info(f"✅ All {len(setup_statements)} statements executed successfully")
         
         # Verify the setup
         logger.info("🔍 Verifying setup...")
@@ -195,6 +208,57 @@ def setup_database_schema(schema_name: str = "nfl", reset: bool = False):
         return False
 
 
+# Asynchronous I/O settings applied by --configure-io (io_method needs PostgreSQL 18+)
+IO_SETTINGS = {
+    'io_method': 'io_uring',
+    'effective_io_concurrency': '64',
+    'maintenance_io_concurrency': '64',
+}
+
+
+def configure_io_settings() -> bool:
+    """Switch the server to io_uring asynchronous I/O with higher I/O concurrency."""
+    logger.info("⚙️  Configuring server asynchronous I/O settings...")
+    
+    try:
+        with PostgreSQLManager() as db:
+            # ALTER SYSTEM cannot run inside a transaction block
+            db._connection.autocommit = True
+            
+            # Only touch settings this server actually has
+            available = dict(db.fetch_all(
+                "SELECT name, context FROM pg_settings WHERE name = ANY(%s)",
+                (list(IO_SETTINGS),)
+            ))
+            if 'io_method' not in available:
+                logger.error("❌ io_method is not supported by this server (requires PostgreSQL 18+)")
+                return False
+            
+            with db._connection.cursor() as cursor:
+                for name, value in IO_SETTINGS.items():
+                    if name in available:
+                        cursor.execute(f"ALTER SYSTEM SET {name} = %s", (value,))
+                        logger.info(f"   ✅ {name} = {value}")
+                cursor.execute("SELECT pg_reload_conf()")
+            
+            if available['io_method'] == 'postmaster':
+                logger.warning("⚠️  Restart PostgreSQL for io_method to take effect "
+                               "(io_uring requires a Linux server built with liburing)")
+            return True
+            
+    except Exception as e:
+        logger.error(f"❌ Failed to configure I/O settings: {e}")
+        return False
+
+
+def stream_rows(db: PostgreSQLManager, cursor_name: str, sql: str, params: tuple, itersize: int = 200):
+    """Yield query rows through a named server-side cursor, fetching `itersize` rows at a time."""
+    with db._connection.cursor(name=cursor_name) as cursor:
+        cursor.itersize = itersize
+        cursor.execute(sql, params)
+        yield from cursor
+
+
 def show_schema_info(schema_name: str = "nfl"):
     """Show detailed information about the current schema."""
     logger.info(f"📋 Schema information for '{schema_name}':")
@@ -202,7 +266,8 @@ def show_schema_info(schema_name: str = "nfl"):
     try:
         with PostgreSQLManager() as db:
             # Get tables
-            tables_result = db.fetch_all(
+            tables_result = stream_rows(
+                db, "schema_tables",
                 """
                 SELECT table_name, table_type
                 FROM information_schema.tables 
@@ -212,13 +277,15 @@ def show_schema_info(schema_name: str = "nfl"):
                 (schema_name,)
             )
             
-            if tables_result:
-                logger.info(f"📦 Tables and Views:")
-                for table_name, table_type in tables_result:
-                    logger.info(f"   - {table_name} ({table_type})")
+            # Rows stream from the server, so each heading is logged with its first row
+            for row_number, (table_name, table_type) in enumerate(tables_result):
+                if row_number == 0:
+                    logger.info(f"📦 Tables and Views:")
+                logger.info(f"   - {table_name} ({table_type})")
             
             # Get indexes
-            indexes_result = db.fetch_all(
+            indexes_result = stream_rows(
+                db, "schema_indexes",
                 """
                 SELECT indexname, tablename
                 FROM pg_indexes 
@@ -228,17 +295,18 @@ def show_schema_info(schema_name: str = "nfl"):
                 (schema_name,)
             )
             
-            if indexes_result:
-                logger.info(f"🔍 Indexes:")
-                current_table = None
-                for index_name, table_name in indexes_result:
-                    if table_name != current_table:
-                        logger.info(f"   {table_name}:")
-                        current_table = table_name
-                    logger.info(f"     - {index_name}")
+            current_table = None
+            for row_number, (index_name, table_name) in enumerate(indexes_result):
+                if row_number == 0:
+                    logger.info(f"🔍 Indexes:")
+                if table_name != current_table:
+                    logger.info(f"   {table_name}:")
+                    current_table = table_name
+                logger.info(f"     - {index_name}")
             
             # Get constraints
-            constraints_result = db.fetch_all(
+            constraints_result = stream_rows(
+                db, "schema_constraints",
                 """
                 SELECT constraint_name, table_name, constraint_type
                 FROM information_schema.table_constraints 
@@ -248,14 +316,14 @@ def show_schema_info(schema_name: str = "nfl"):
                 (schema_name,)
             )
             
-            if constraints_result:
-                logger.info(f"🔗 Constraints:")
-                current_table = None
-                for constraint_name, table_name, constraint_type in constraints_result:
-                    if table_name != current_table:
-                        logger.info(f"   {table_name}:")
-                        current_table = table_name
-                    logger.info(f"     - {constraint_name} ({constraint_type})")
+            current_table = None
+            for row_number, (constraint_name, table_name, constraint_type) in enumerate(constraints_result):
+                if row_number == 0:
+                    logger.info(f"🔗 Constraints:")
+                if table_name != current_table:
+                    logger.info(f"   {table_name}:")
+                    current_table = table_name
+                logger.info(f"     - {constraint_name} ({constraint_type})")
                     
     except Exception as e:
         logger.error(f"Failed to get schema info: {e}")
@@ -275,6 +343,7 @@ Examples:
     python setup_database.py --reset            # Reset and recreate
     python setup_database.py --test             # Test connection only
     python setup_database.py --info             # Show schema info
+    python setup_database.py --configure-io     # Enable io_uring I/O (PostgreSQL 18+)
         """
     )
     
@@ -303,6 +372,12 @@ Examples:
         help='Show information about existing schema'
     )
     
+    parser.add_argument(
+        '--configure-io',
+        action='store_true',
+        help='Enable io_uring asynchronous I/O on the server (PostgreSQL 18+, superuser)'
+    )
+    
     args = parser.parse_args()
     
     logger.info("🏈 All Sports Reference - Database Setup")
@@ -322,6 +397,9 @@ Examples:
         show_schema_info(args.schema)
         return
     
+    if args.configure_io:
+        sys.exit(0 if configure_io_settings() else 1)
+    
     # Setup the schema
     success = setup_database_schema(args.schema, args.reset)
     
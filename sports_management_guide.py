@@ -21,6 +21,7 @@ Each sport has:
 
 import sys
 import os
+import functools
 from pathlib import Path
 from loguru import logger
 from dotenv import load_dotenv
@@ -43,6 +44,79 @@ def setup_logging():
     )
 
 
+SPORT_SCHEMAS = ('nfl', 'nba', 'nhl')
+
+# Per-sport SQL fragments, built once at import and combined with UNION ALL by the demonstrations
+SPORT_SUMMARY_SQL = {
+    schema: f"""
+        SELECT '{schema}' as sport,
+               COUNT(*) as total_games,
+               MIN(date) as min_date,
+               MAX(date) as max_date,
+               COUNT(DISTINCT boxscore_id) as unique_boxscores,
+               COUNT(DISTINCT team) as unique_teams,
+               COUNT(DISTINCT season) as unique_seasons
+        FROM {schema}.game_logs
+    """
+    for schema in SPORT_SCHEMAS
+}
+SPORT_GAMES_SQL = {
+    schema: f"""
+        SELECT '{schema.upper()}' as sport, team, opponent, result,
+               team_score, opp_score, date, boxscore_id, season
+        FROM {schema}.game_logs
+    """
+    for schema in SPORT_SCHEMAS
+}
+SPORT_GAME_COUNT_SQL = {
+    schema: f"SELECT '{schema}', COUNT(*) FROM {schema}.game_logs" for schema in SPORT_SCHEMAS
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_existing_sport_schemas() -> frozenset:
+    """
+    Get the sport schemas that exist, queried once and shared by every demonstration.
+    """
+    from src.nfl.database import PostgreSQLManager
+    
+    with PostgreSQLManager() as db:
+        return frozenset(
+            row[0] for row in db.fetch_all(
+                "SELECT schema_name FROM information_schema.schemata WHERE schema_name = ANY(%s)",
+                (list(SPORT_SCHEMAS),)
+            )
+        )
+
+
+def _fetch_across_sports(db, schemas, description, build_sql, build_params=None):
+    """
+    Run a query spanning several sport schemas, falling back to one query per sport if it fails.
+    
+    build_sql (and build_params, if given) take a list of schemas, so the same
+    builders serve the combined query and the per-sport retries. A sport whose
+    own query fails is logged and skipped without hiding the others' rows.
+    """
+    if not schemas:
+        return []
+    
+    try:
+        return db.fetch_all(build_sql(schemas), build_params(schemas) if build_params else None)
+    except Exception as e:
+        # psycopg2 aborts the transaction on error, so clear it before retrying
+        db._connection.rollback()
+        logger.warning(f"   Combined {description} query failed, querying each sport separately: {e}")
+    
+    rows = []
+    for schema in schemas:
+        try:
+            rows.extend(db.fetch_all(build_sql([schema]), build_params([schema]) if build_params else None))
+        except Exception as e:
+            db._connection.rollback()
+            logger.warning(f"   {schema.upper()}: Error querying {description} - {e}")
+    return rows
+
+
 def demonstrate_cross_sport_queries():
     """
     Demonstrate cross-sport database queries and analytics.
@@ -57,97 +131,86 @@ def demonstrate_cross_sport_queries():
             # Query 1: Get all sports data summary
             logger.info("📊 Multi-Sport Database Summary:")
             
-            sport_schemas = ['nfl', 'nba', 'nhl']
-            for schema in sport_schemas:
-                try:
-                    # Check if schema exists
-                    schema_check = db.fetch_one(
-                        "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                        (schema,)
+            sport_schemas = SPORT_SCHEMAS
+            existing_schemas = [schema for schema in sport_schemas if schema in get_existing_sport_schemas()]
+            
+            # Only schemas that actually have a game_logs table go into the combined queries
+            queryable_schemas = []
+            if existing_schemas:
+                with_game_logs = {
+                    row[0] for row in db.fetch_all(
+                        "SELECT s FROM unnest(%s::text[]) s WHERE to_regclass(quote_ident(s) || '.game_logs') IS NOT NULL",
+                        (existing_schemas,)
                     )
-                    
-                    if schema_check:
-                        # Get record count
-                        count_result = db.fetch_one(f"SELECT COUNT(*) FROM {schema}.game_logs")
-                        count = count_result[0] if count_result else 0
-                        
-                        # Get date range
-                        date_result = db.fetch_one(
-                            f"SELECT MIN(date) as min_date, MAX(date) as max_date FROM {schema}.game_logs"
-                        )
-                        
-                        if date_result and date_result[0]:
-                            min_date, max_date = date_result
-                            logger.info(f"   {schema.upper()}: {count} games ({min_date} to {max_date})")
-                        else:
-                            logger.info(f"   {schema.upper()}: {count} games (no date data)")
+                }
+                queryable_schemas = [schema for schema in existing_schemas if schema in with_game_logs]
+            
+            # Every per-sport aggregate comes back from one UNION ALL query
+            summary_rows = _fetch_across_sports(
+                db, queryable_schemas, "summary",
+                lambda schemas: " UNION ALL ".join(SPORT_SUMMARY_SQL[schema] for schema in schemas)
+            )
+            summaries = {row[0]: row[1:] for row in summary_rows}
+            
+            for schema in sport_schemas:
+                if schema not in existing_schemas:
+                    logger.info(f"   {schema.upper()}: Schema not found")
+                elif schema not in queryable_schemas:
+                    logger.info(f"   {schema.upper()}: game_logs table not found")
+                elif schema not in summaries:
+                    logger.info(f"   {schema.upper()}: No summary available")
+                else:
+                    count, min_date, max_date = summaries[schema][:3]
+                    if min_date:
+                        logger.info(f"   {schema.upper()}: {count} games ({min_date} to {max_date})")
                     else:
-                        logger.info(f"   {schema.upper()}: Schema not found")
-                        
-                except Exception as e:
-                    logger.warning(f"   {schema.upper()}: Error querying - {e}")
+                        logger.info(f"   {schema.upper()}: {count} games (no date data)")
             
             # Query 2: Recent games across all sports
             logger.info("\n🎮 Recent Games Across All Sports:")
             
-            for schema in sport_schemas:
-                try:
-                    schema_check = db.fetch_one(
-                        "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                        (schema,)
-                    )
-                    
-                    if schema_check:
-                        recent_games = db.fetch_all(
-                            f"""
-                            SELECT '{schema.upper()}' as sport, team, opponent, result, 
-                                   team_score, opp_score, date, boxscore_id
-                            FROM {schema}.game_logs 
-                            ORDER BY date DESC 
-                            LIMIT 3
-                            """
-                        )
-                        
-                        for game in recent_games:
-                            sport, team, opponent, result, team_score, opp_score, date, boxscore_id = game
-                            logger.info(f"   {sport}: {team} vs {opponent} ({result} {team_score}-{opp_score}) - {date} [{boxscore_id}]")
-                            
-                except Exception as e:
-                    logger.warning(f"   Error querying recent {schema} games: {e}")
+            # Latest three games per sport, ranked within each sport in one query
+            recent_games = _fetch_across_sports(
+                db, queryable_schemas, "recent games",
+                lambda schemas: """
+                    SELECT sport, team, opponent, result, team_score, opp_score, date, boxscore_id
+                    FROM (
+                        SELECT games.*,
+                               ROW_NUMBER() OVER (PARTITION BY sport ORDER BY date DESC) as sport_rank
+                        FROM ({}) games
+                    ) ranked
+                    WHERE sport_rank <= 3
+                    ORDER BY array_position(%s, sport), sport_rank
+                """.format(" UNION ALL ".join(SPORT_GAMES_SQL[schema] for schema in schemas)),
+                lambda schemas: ([schema.upper() for schema in schemas],)
+            )
+            
+            for game in recent_games:
+                sport, team, opponent, result, team_score, opp_score, date, boxscore_id = game
+                logger.info(f"   {sport}: {team} vs {opponent} ({result} {team_score}-{opp_score}) - {date} [{boxscore_id}]")
             
             # Query 3: Boxscore ID analysis
             logger.info("\n🔗 Boxscore ID Linking Analysis:")
             
-            for schema in sport_schemas:
-                try:
-                    schema_check = db.fetch_one(
-                        "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                        (schema,)
-                    )
-                    
-                    if schema_check:
-                        boxscore_stats = db.fetch_one(
-                            f"""
-                            SELECT 
-                                COUNT(*) as total_games,
-                                COUNT(DISTINCT boxscore_id) as unique_boxscores,
-                                COUNT(DISTINCT team) as unique_teams,
-                                COUNT(DISTINCT season) as unique_seasons
-                            FROM {schema}.game_logs
-                            """
-                        )
-                        
-                        if boxscore_stats:
-                            total, unique_box, unique_teams, unique_seasons = boxscore_stats
-                            logger.info(f"   {schema.upper()}: {total} games, {unique_box} unique boxscores, {unique_teams} teams, {unique_seasons} seasons")
-                            
-                except Exception as e:
-                    logger.warning(f"   Error analyzing {schema} boxscores: {e}")
+            for schema in existing_schemas:
+                if schema in summaries:
+                    total, _, _, unique_box, unique_teams, unique_seasons = summaries[schema]
+                    logger.info(f"   {schema.upper()}: {total} games, {unique_box} unique boxscores, {unique_teams} teams, {unique_seasons} seasons")
+                else:
+                    logger.info(f"   {schema.upper()}: No boxscore data available")
                     
     except Exception as e:
         logger.error(f"Failed to demonstrate cross-sport queries: {e}")
 
 
+# Sport-specific game_logs columns reported by demonstrate_sport_specific_features
+SPORT_STAT_COLUMNS = {
+    'nfl': ('pass_yds', 'rush_yds', 'pass_td', 'rush_td'),
+    'nba': ('fg_made', 'fg_att', 'fg3_made', 'fg3_att', 'treb', 'ast'),
+    'nhl': ('goals', 'assists', 'shots', 'saves', 'pp_goals', 'penalty_minutes'),
+}
+
+
 def demonstrate_sport_specific_features():
     """
     Demonstrate sport-specific database features and statistics.
@@ -159,27 +222,31 @@ def demonstrate_sport_specific_features():
     
     try:
         with PostgreSQLManager() as db:
+            # Look up every sport's stat columns in one catalog query
+            wanted = [(schema, column) for schema, columns in SPORT_STAT_COLUMNS.items() for column in columns]
+            sport_columns = {}
+            for schema, column in db.fetch_all(
+                """
+                SELECT c.table_schema, c.column_name
+                FROM unnest(%s::text[], %s::text[]) AS wanted(schema_name, column_name)
+                JOIN information_schema.columns c
+                  ON c.table_schema = wanted.schema_name
+                 AND c.column_name = wanted.column_name
+                 AND c.table_name = 'game_logs'
+                ORDER BY c.table_schema, c.column_name
+                """,
+                ([schema for schema, _ in wanted], [column for _, column in wanted])
+            ):
+                sport_columns.setdefault(schema, []).append(column)
+            
             # NFL specific features
             logger.info("🏈 NFL Features:")
             try:
-                nfl_check = db.fetch_one(
-                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = 'nfl'"
-                )
-                
-                if nfl_check:
+                if 'nfl' in get_existing_sport_schemas():
                     # Check for NFL-specific columns
-                    nfl_columns = db.fetch_all(
-                        """
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'nfl' AND table_name = 'game_logs'
-                        AND column_name IN ('pass_yds', 'rush_yds', 'pass_td', 'rush_td')
-                        ORDER BY column_name
-                        """
-                    )
+                    columns = sport_columns.get('nfl')
                     
-                    if nfl_columns:
-                        columns = [row[0] for row in nfl_columns]
+                    if columns:
                         logger.info(f"   Football-specific stats: {', '.join(columns)}")
                         
                         # Sample NFL stats
@@ -207,24 +274,11 @@ def demonstrate_sport_specific_features():
             # NBA specific features
             logger.info("\n🏀 NBA Features:")
             try:
-                nba_check = db.fetch_one(
-                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = 'nba'"
-                )
-                
-                if nba_check:
+                if 'nba' in get_existing_sport_schemas():
                     # Check for NBA-specific columns
-                    nba_columns = db.fetch_all(
-                        """
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'nba' AND table_name = 'game_logs'
-                        AND column_name IN ('fg_made', 'fg_att', 'fg3_made', 'fg3_att', 'treb', 'ast')
-                        ORDER BY column_name
-                        """
-                    )
+                    columns = sport_columns.get('nba')
                     
-                    if nba_columns:
-                        columns = [row[0] for row in nba_columns]
+                    if columns:
                         logger.info(f"   Basketball-specific stats: {', '.join(columns)}")
                         logger.info("   Ready for NBA data collection with shooting percentages, rebounds, assists")
                     else:
@@ -238,24 +292,11 @@ def demonstrate_sport_specific_features():
             # NHL specific features  
             logger.info("\n🏒 NHL Features:")
             try:
-                nhl_check = db.fetch_one(
-                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = 'nhl'"
-                )
-                
-                if nhl_check:
+                if 'nhl' in get_existing_sport_schemas():
                     # Check for NHL-specific columns
-                    nhl_columns = db.fetch_all(
-                        """
-                        SELECT column_name 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'nhl' AND table_name = 'game_logs'
-                        AND column_name IN ('goals', 'assists', 'shots', 'saves', 'pp_goals', 'penalty_minutes')
-                        ORDER BY column_name
-                        """
-                    )
+                    columns = sport_columns.get('nhl')
                     
-                    if nhl_columns:
-                        columns = [row[0] for row in nhl_columns]
+                    if columns:
                         logger.info(f"   Hockey-specific stats: {', '.join(columns)}")
                         logger.info("   Ready for NHL data collection with goals, assists, power plays, penalties")
                     else:
@@ -285,34 +326,13 @@ def demonstrate_unified_queries():
             logger.info("📋 Creating unified sports view...")
             
             # Check which sports schemas exist
-            existing_schemas = []
-            for schema in ['nfl', 'nba', 'nhl']:
-                schema_check = db.fetch_one(
-                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                    (schema,)
-                )
-                if schema_check:
-                    existing_schemas.append(schema)
+            existing_schemas = [schema for schema in SPORT_SCHEMAS if schema in get_existing_sport_schemas()]
             
             if existing_schemas:
                 logger.info(f"   Found schemas: {', '.join(existing_schemas)}")
                 
                 # Example unified query - get games from all sports
-                union_parts = []
-                for schema in existing_schemas:
-                    union_parts.append(f"""
-                        SELECT 
-                            '{schema.upper()}' as sport,
-                            team,
-                            opponent, 
-                            result,
-                            team_score,
-                            opp_score,
-                            date,
-                            boxscore_id,
-                            season
-                        FROM {schema}.game_logs
-                    """)
+                union_parts = [SPORT_GAMES_SQL[schema] for schema in existing_schemas]
                 
                 if union_parts:
                     unified_query = " UNION ALL ".join(union_parts) + " ORDER BY date DESC LIMIT 10"
@@ -324,11 +344,12 @@ def demonstrate_unified_queries():
                         sport, team, opponent, result, team_score, opp_score, date, boxscore_id, season = game
                         logger.info(f"   {sport}: {team} vs {opponent} ({result} {team_score}-{opp_score}) - {date} S{season}")
                 
-                # Sport comparison query
+                # Sport comparison query, all counts in one round trip
                 logger.info("\n📊 Games by sport:")
-                for schema in existing_schemas:
-                    count_result = db.fetch_one(f"SELECT COUNT(*) FROM {schema}.game_logs")
-                    count = count_result[0] if count_result else 0
+                count_results = db.fetch_all(" UNION ALL ".join(
+                    SPORT_GAME_COUNT_SQL[schema] for schema in existing_schemas
+                ))
+                for schema, count in count_results:
                     logger.info(f"   {schema.upper()}: {count} games")
                     
             else: